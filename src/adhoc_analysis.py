@@ -124,6 +124,8 @@ async def analyze_market():
     # Close connectors
     for conn in active_connectors.values():
         await conn.close()
+    if notification_service:
+        await notification_service.close()
         
     # --- Generate Advice Report ---
     print("\n" + "="*30 + " 交易建议报告 " + "="*30)
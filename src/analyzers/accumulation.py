@@ -76,17 +76,13 @@ class AccumulationAnalyzer:
             if now - self.cooldowns[symbol] < self.cooldown_sec:
                 return None
 
-        from src.utils.dataframe_helpers import get_latest_values
-        latest_rows = get_latest_values(df, n=2)
-        if latest_rows[0] is None or latest_rows[1] is None:
+        from src.utils.dataframe_helpers import get_latest_array
+        latest = get_latest_array(df, ['close', 'volume'], n=2)
+        if latest is None:
             return None
 
-        current = latest_rows[0]
-        prev = latest_rows[1]
-
-        close_price = current['close']
-        volume = current['volume']
-        prev_close = prev['close']
+        close_price, volume = latest[0]
+        prev_close = latest[1, 0]
 
         if close_price <= 0 or prev_close <= 0:
             return None
@@ -125,16 +125,15 @@ class EarlyPumpAnalyzer:
                 return None
 
         # Get latest closed candle (optimized access)
-        from src.utils.dataframe_helpers import get_latest_values
-        latest_rows = get_latest_values(df, n=2)
-        if latest_rows[0] is None or latest_rows[1] is None:
+        from src.utils.dataframe_helpers import get_latest_array
+        has_taker_buy = 'taker_buy_volume' in df.columns
+        cols = ['open', 'close', 'volume', 'taker_buy_volume'] if has_taker_buy else ['open', 'close', 'volume']
+        latest = get_latest_array(df, cols, n=2)
+        if latest is None:
             return None
-        current = latest_rows[0]
-        prev = latest_rows[1]
+        open_price, close_price, current_volume = latest[0, :3]
 
         # 1. Price Check: Close > Open significantly
-        open_price = current['open']
-        close_price = current['close']
         
         if open_price <= 0:
             return None
@@ -154,14 +153,14 @@ class EarlyPumpAnalyzer:
         if avg_vol <= 0:
             avg_vol = 1.0 # Protect division
             
-        vol_ratio = current['volume'] / avg_vol
+        vol_ratio = current_volume / avg_vol
         
         if vol_ratio < self.vol_factor:
             return None
             
         # 3. Taker Buy Ratio
-        taker_buy = current.get('taker_buy_volume', 0)
-        total_vol = current['volume']
+        taker_buy = latest[0, 3] if has_taker_buy else 0
+        total_vol = current_volume
         
         if total_vol > 0:
             buy_ratio = taker_buy / total_vol
@@ -218,10 +217,11 @@ class EarlyPumpAnalyzer:
             # Check for recent Buy whales (last 3 minutes approx)
             # Simple check: any buy whale in the passed list?
             # Assuming 'whales' passed are relevant to current time
-            buy_whales = [w for w in whales if w['side'].upper() == 'BUY']
-            if buy_whales:
+            # 一次遍历只取出买方大单金额
+            buy_costs = [w['cost'] for w in whales if w['side'].upper() == 'BUY']
+            if buy_costs:
                 whale_bonus = True
-                total_whale_vol = sum(w['cost'] for w in buy_whales)
+                total_whale_vol = sum(buy_costs)
                 desc_parts.append(f"🐋主力抢筹${total_whale_vol/1000:.0f}k")
 
         # Determine grade based on all factors
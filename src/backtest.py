@@ -3,7 +3,7 @@ import pandas as pd
 import numpy as np
 import itertools
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
 import sys
 import os
 
@@ -17,8 +17,22 @@ from src.analyzers.taker_flow import TakerFlowAnalyzer
 from src.analyzers.accumulation import AccumulationAnalyzer
 from src.utils.logger import logger
 
+def build_param_combinations(param_grid: Dict) -> List[tuple]:
+    """生成参数组合（笛卡尔积），数量受 STRATEGY_LEARNING_MAX_PARAM_COMBINATIONS 限制"""
+    total_combinations = 1
+    for values in param_grid.values():
+        total_combinations *= len(values)
+    
+    # 限制参数组合数
+    max_combinations = Config.STRATEGY_LEARNING_MAX_PARAM_COMBINATIONS
+    if total_combinations > max_combinations:
+        logger.info(f"⚠️  参数组合数 {total_combinations} 超过限制，将只测试前 {max_combinations} 个组合")
+    
+    return list(itertools.islice(itertools.product(*param_grid.values()), max_combinations))
+
+
 class Backtester:
-    def __init__(self, symbol: str, days: int = 3, connector: BinanceConnector = None):
+    def __init__(self, symbol: str, days: int = 3, connector: Optional[BinanceConnector] = None):
         self.symbol = symbol
         self.days = days
         self.connector = connector
@@ -31,6 +45,8 @@ class Backtester:
         self.initial_balance = 10000.0
         self.position = None
         self.should_close_connector = False
+        # 与策略参数无关的指标只计算一次，网格搜索中各参数组合共享
+        self._indicators_ready = False
     
     async def prepare_data(self):
         print(f"🔄 Fetching {self.days} days of data for {self.symbol}...")
@@ -132,6 +148,7 @@ class Backtester:
             df.sort_index(inplace=True)
             
             self.df_1m = df
+            self._indicators_ready = False
             
             self.df_5m = self.resample_data(self.df_1m, '5min')
             self.df_15m = self.resample_data(self.df_1m, '15min')
@@ -160,7 +177,10 @@ class Backtester:
         if print_results:
             print("🚀 Starting Backtest...")
         
-        self.df_1m = self.taker_analyzer.analyze_df_batch(self.df_1m)
+        # 资金流/区间指标与吸筹信号不依赖策略参数，只在首次运行时计算
+        first_pass = not self._indicators_ready
+        if first_pass:
+            self._prepare_indicators()
         
         for i in range(50, len(self.df_1m)):
             current_bar = self.df_1m.iloc[i]
@@ -172,13 +192,25 @@ class Backtester:
             if not self.position:
                 self.check_entry(i, current_time)
 
-            if i % 15 == 0:
+            if first_pass and i % 15 == 0:
                 self._check_accumulation(current_time)
                 
         if print_results:
             self.print_results()
             self._print_accumulation_stats()
 
+    def _prepare_indicators(self):
+        """计算与参数无关的指标并缓存：资金流列，以及 check_entry 使用的15根K线区间 ATR/高低点"""
+        self.df_1m = self.taker_analyzer.analyze_df_batch(self.df_1m)
+        
+        window = 15  # 当前K线及之前14根
+        high = self.df_1m['high']
+        low = self.df_1m['low']
+        self._range_atr = (high - low).rolling(window).mean().to_numpy()
+        self._range_low = low.rolling(window).min().to_numpy()
+        self._range_high = high.rolling(window).max().to_numpy()
+        self._indicators_ready = True
+
     def check_exit(self, bar, timestamp):
         pos = self.position
         side = pos['side']
@@ -240,13 +272,9 @@ class Backtester:
         
         atr_period = 14
         if index > atr_period:
-            high = self.df_1m['high'].iloc[index-atr_period:index+1]
-            low = self.df_1m['low'].iloc[index-atr_period:index+1]
-            tr = high - low
-            metrics['atr'] = tr.mean()
-            
-            metrics['support_low'] = low.min()
-            metrics['resistance_high'] = high.max()
+            metrics['atr'] = self._range_atr[index]
+            metrics['support_low'] = self._range_low[index]
+            metrics['resistance_high'] = self._range_high[index]
             
         platform_metrics = {'binance': metrics}
         
@@ -343,28 +371,26 @@ class Backtester:
         
         return max_drawdown
 
-    def grid_search(self, param_grid: Dict) -> Dict:
+    def grid_search(self, param_grid: Dict, combinations: Optional[List[tuple]] = None) -> Dict:
+        """网格搜索最优参数
+
+        Args:
+            param_grid: 参数网格 {参数名: 候选值列表}
+            combinations: 预先生成的参数组合（顺序与 param_grid 的键一致），为 None 时现场生成
+        """
         best_params = None
         best_winrate = 0.0
         best_results = None
         
-        total_combinations = 1
-        for values in param_grid.values():
-            total_combinations *= len(values)
-        
-        # 限制参数组合数
-        max_combinations = Config.STRATEGY_LEARNING_MAX_PARAM_COMBINATIONS
-        if total_combinations > max_combinations:
-            logger.info(f"⚠️  参数组合数 {total_combinations} 超过限制，将只测试前 {max_combinations} 个组合")
+        if combinations is None:
+            combinations = build_param_combinations(param_grid)
+        keys = list(param_grid.keys())
         
         current_combo = 0
+        total_to_test = len(combinations)
         
-        # 生成所有参数组合并限制数量
-        all_combinations = list(itertools.product(*param_grid.values()))[:max_combinations]
-        total_to_test = len(all_combinations)
-        
-        for params in all_combinations:
-            param_dict = dict(zip(param_grid.keys(), params))
+        for params in combinations:
+            param_dict = dict(zip(keys, params))
             current_combo += 1
             
             self.strategy = EntryExitStrategy(**param_dict)
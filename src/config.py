@@ -39,9 +39,12 @@ class Config:
     RATE_LIMIT_DELAY = 1.0  # 秒
     
     # 策略学习配置
-    STRATEGY_LEARNING_MAX_CONCURRENT = 1  # 最大并发回测数量（顺序执行，0表示无限）
+    STRATEGY_LEARNING_MAX_CONCURRENT = 4  # 最大并发回测数量（1表示顺序执行，0表示无限）
     STRATEGY_LEARNING_MAX_PARAM_COMBINATIONS = 20  # 每品种最大参数组合数
     
+    # 品种筛选配置
+    SYMBOL_SELECTION_MAX_CONCURRENT = 8  # 品种筛选时并发拉取K线的最大数量
+    
     # 24小时成交额过滤（只监控成交额大于此值的币种）
     MIN_24H_QUOTE_VOLUME = 30000000  # 30M USDT
     
@@ -119,6 +122,9 @@ class Config:
     REALTIME_PUMP_THRESHOLD = 2.0          # 涨幅阈值 % (Raise to avoid noise)
     REALTIME_MIN_VOLUME = 100000           # 最小成交额 USDT
     REALTIME_BLACKLIST = ["UPUSDT", "DOWNUSDT", "BULLUSDT", "BEARUSDT", "BUSDUSDT", "USDCUSDT"]
+    REALTIME_CHUNK_SIZE = 500              # 每个 WebSocket 连接订阅的流数量（币安单连接上限 1024）
+    REALTIME_WS_MAX_QUEUE = 4096           # 每个连接的接收缓冲消息数（websockets 默认 32），吸收突发行情
+    REALTIME_ALERT_MAX_CONCURRENT = 4      # 同时发送中的实时告警通知上限（钉钉/Telegram）
 
     # ==================== 15分钟K线资金暴增监控配置 ====================
     ENABLE_15M_VOLUME_MONITOR = True          # 是否启用 15m K线资金暴增监控
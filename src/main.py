@@ -1,6 +1,6 @@
 import asyncio
 import time
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 import pandas as pd
 from loguru import logger
 from src.config import Config
@@ -117,8 +117,8 @@ async def process_symbol(symbol: str, ctx: AnalysisContext) -> None:
         logger.critical(f"🚨 [{symbol}] 信号触发 [{signal['grade']}]: {signal['type']} - {signal['desc']}")
         if ctx.notification_service:
             await ctx.notification_service.dispatch_signal(signal, platform_metrics, symbol)
-        if ctx.persistence:
-            ctx.persistence.save_signal(signal, platform_metrics, symbol)
+    if ctx.persistence:
+        ctx.persistence.save_signals_many(signals, platform_metrics, symbol)
     
     # 4. Generate recommendations
     await generate_recommendations(
@@ -289,7 +289,12 @@ async def main():
             for i in range(0, len(target_symbols), chunk_size):
                 chunk = target_symbols[i:i+chunk_size]
                 tasks = [process_symbol(sym, ctx) for sym in chunk]
-                await asyncio.gather(*tasks)
+                # 同一 gather 内的策略评估共用一次时间戳；按块取时，整轮扫描耗时不会提前冷却
+                strategy.begin_batch()
+                try:
+                    await asyncio.gather(*tasks)
+                finally:
+                    strategy.end_batch()
 
                 # Increased sleep between chunks to reduce API requests
                 await asyncio.sleep(Config.RATE_LIMIT_DELAY * 2)
@@ -328,9 +333,20 @@ async def main():
                 logger.info("资金费率监控任务已取消")
             except Exception as e:
                 logger.error(f"取消资金费率监控任务时出错: {e}")
+        
+        if notification_service:
+            await notification_service.close()
 
 if __name__ == "__main__":
+    # uvloop 基于 libuv，大量 WebSocket 连接下系统调用开销更低；未安装（如 Windows）时使用默认事件循环
+    run: Callable[..., Any]
+    try:
+        import uvloop
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         pass
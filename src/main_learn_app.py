@@ -174,7 +174,7 @@ async def scan_and_notify(
         return last_notified
     
     try:
-        selector = SymbolSelector(strategy)
+        selector = SymbolSelector(strategy, connector=binance)
         selected_symbols = await selector.select_symbols(all_symbols)
         
         # 找出新增的品种
@@ -219,7 +219,7 @@ async def run_learning_cycle(cycle_num: int, args, notification_service, binance
         
         # 2. 策略学习
         logger.info("🔍 开始策略学习...")
-        learner = StrategyLearner()
+        learner = StrategyLearner(connector=binance)
         results = await learner.learn(symbols=top_symbols, days=args.days)
         
         if results and 'global' in results:
@@ -400,6 +400,8 @@ async def main():
     finally:
         if binance:
             await binance.close()
+        if notification_service:
+            await notification_service.close()
         logger.info("👋 程序已退出")
 
 
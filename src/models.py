@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import Optional
 
 @dataclass
@@ -14,3 +14,30 @@ class StandardCandle:
     quote_volume: Optional[float] = None # Total Quote Volume
     volume_type: str = 'base' # 'base' or 'quote'
     exchange_id: str = ''
+
+
+@dataclass(slots=True)
+class PumpAlert:
+    """实时拉盘告警 (RealtimeMonitor -> NotificationService)"""
+    symbol: str
+    change_pct: float
+    volume: float  # Quote volume (USDT)
+    price: float
+    is_closed: bool
+    market_type: str  # 'spot' or 'futures'
+    market_label: str
+
+
+@dataclass(slots=True)
+class Position:
+    """持仓记录 (PositionManager)"""
+    symbol: str
+    size: float  # 仓位大小（币数）
+    notional: float  # 名义价值（USDT）
+    risk_amount: float  # 风险金额（USDT）
+    entry_price: Optional[float] = None
+    stop_loss: Optional[float] = None
+    take_profit: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
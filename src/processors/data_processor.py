@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from typing import List
+from typing import List, Tuple
 from src.models import StandardCandle
 from src.utils.logger import logger
 
@@ -70,6 +71,28 @@ class DataProcessor:
         
         return df
 
+    @staticmethod
+    def process_candles_np(candles: List[StandardCandle]) -> Tuple[np.ndarray, ...]:
+        """
+        Converts candles into plain NumPy arrays without building a DataFrame.
+        
+        Returns:
+            (open, high, low, close, volume) float64 arrays, sorted by timestamp.
+        """
+        if not candles:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty, empty, empty, empty
+        
+        arr = np.array(
+            [(c.timestamp, c.open, c.high, c.low, c.close, c.volume) for c in candles],
+            dtype=np.float64
+        )
+        ts = arr[:, 0]
+        if (np.diff(ts) < 0).any():
+            arr = arr[np.argsort(ts, kind='stable')]
+        
+        return arr[:, 1], arr[:, 2], arr[:, 3], arr[:, 4], arr[:, 5]
+
     @staticmethod
     def align_dataframes(dfs: List[pd.DataFrame]) -> pd.DataFrame:
         """
@@ -454,3 +454,4 @@ class FundingRateMonitor:
                 await connector.close()
             except Exception as e:
                 logger.error(f"❌ 关闭连接器失败: {e}")
+        await self.notification_service.close()
@@ -4,10 +4,11 @@ import hashlib
 import base64
 import urllib.parse
 import aiohttp
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 from src.utils.logger import logger
 from src.config import Config
+from src.models import PumpAlert
 
 # 延迟导入异常类，避免循环导入
 if TYPE_CHECKING:
@@ -47,6 +48,26 @@ class NotificationService:
         # 消息队列（用于 B 级信号汇总）
         self.pending_b_signals = []
         self.last_b_summary_time = time.time()
+        
+        # 钉钉加签缓存 {secret: (秒级时间戳, URL后缀)}，同一秒内的突发推送复用同一签名
+        self._dingtalk_sign_cache: Dict[str, Tuple[int, str]] = {}
+        
+        # 推送共享的 HTTP 会话（首次推送时创建），复用到 webhook 的 keep-alive 连接，免去每条消息的 TLS 握手
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """获取共享的 HTTP 会话，不存在或已关闭时创建"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
+    
+    async def close(self):
+        """关闭共享的 HTTP 会话"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     def _generate_dingtalk_sign(self, timestamp: int, secret: str) -> str:
         """
@@ -61,6 +82,22 @@ class NotificationService:
         sign = urllib.parse.quote_plus(base64.b64encode(hmac_code))
         return sign
     
+    def _get_dingtalk_sign_suffix(self, secret: str) -> str:
+        """
+        获取钉钉加签 URL 后缀 (&timestamp=...&sign=...)
+        按 (secret, 秒) 缓存，命中时只需一次字符串拼接
+        """
+        ts_sec = int(time.time())
+        cached = self._dingtalk_sign_cache.get(secret)
+        if cached is not None and cached[0] == ts_sec:
+            return cached[1]
+        
+        timestamp = ts_sec * 1000
+        sign = self._generate_dingtalk_sign(timestamp, secret)
+        suffix = f"&timestamp={timestamp}&sign={sign}"
+        self._dingtalk_sign_cache[secret] = (ts_sec, suffix)
+        return suffix
+    
     async def send_dingtalk(self, message: str, at_all: bool = False, webhook: str = None, secret: str = None) -> bool:
         """
         发送钉钉消息
@@ -76,22 +113,20 @@ class NotificationService:
         target_secret = secret or self.dingtalk_secret
         
         if not target_webhook:
-            logger.debug(f"❌ 钉钉推送失败: webhook为空")
+            logger.debug("❌ 钉钉推送失败: webhook为空")
             return False
         
-        logger.debug(f"📤 准备发送钉钉消息: webhook={target_webhook[:30]}..., at_all={at_all}")
+        logger.debug("📤 准备发送钉钉消息: webhook={}..., at_all={}", target_webhook[:30], at_all)
         
         try:
             # 构建 URL（含加签）
-            timestamp = int(time.time() * 1000)
             url = target_webhook
             
             if target_secret:
-                sign = self._generate_dingtalk_sign(timestamp, target_secret)
-                url = f"{url}&timestamp={timestamp}&sign={sign}"
-                logger.debug(f"🔐 钉钉URL已加签")
+                url = target_webhook + self._get_dingtalk_sign_suffix(target_secret)
+                logger.debug("🔐 钉钉URL已加签")
             else:
-                logger.debug(f"🔓 钉钉URL未加签")
+                logger.debug("🔓 钉钉URL未加签")
             
             # 构建消息体
             payload = {
@@ -104,29 +139,28 @@ class NotificationService:
             
             if at_all:
                 payload["at"] = {"isAtAll": True}
-                logger.debug(f"🔔 钉钉消息将@所有人")
+                logger.debug("🔔 钉钉消息将@所有人")
             
             # 发送请求
-            logger.debug(f"📡 发送钉钉HTTP请求...")
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    logger.debug(f"📊 钉钉响应状态码: {resp.status}")
-                    result = await resp.json()
-                    logger.debug(f"📝 钉钉响应内容: {result}")
-                    if result.get('errcode') == 0:
-                        logger.info("✅ 钉钉消息发送成功")
-                        return True
-                    else:
-                        logger.error(f"❌ 钉钉消息发送失败: {result}")
-                        return False
+            logger.debug("📡 发送钉钉HTTP请求...")
+            async with self._get_session().post(url, json=payload, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                logger.debug("📊 钉钉响应状态码: {}", resp.status)
+                result = await resp.json()
+                logger.debug("📝 钉钉响应内容: {}", result)
+                if result.get('errcode') == 0:
+                    logger.info("✅ 钉钉消息发送成功")
+                    return True
+                else:
+                    logger.error("❌ 钉钉消息发送失败: {}", result)
+                    return False
         
         except (aiohttp.ClientError, ValueError, KeyError) as e:
-            logger.error(f"❌ 钉钉推送异常: {e}")
+            logger.error("❌ 钉钉推送异常: {}", e)
             logger.exception(e)
             # 只记录日志，不抛出异常，防止主程序崩溃
             return False
         except Exception as e:
-            logger.error(f"❌ 钉钉推送未知异常: {e}")
+            logger.error("❌ 钉钉推送未知异常: {}", e)
             logger.exception(e)
             # 只记录日志，不抛出异常，防止主程序崩溃
             return False
@@ -143,10 +177,10 @@ class NotificationService:
         target_webhook = webhook or self.wechat_webhook
         
         if not target_webhook:
-            logger.debug(f"❌ 企业微信推送失败: webhook为空")
+            logger.debug("❌ 企业微信推送失败: webhook为空")
             return False
         
-        logger.debug(f"📤 准备发送企业微信消息: webhook={target_webhook[:30]}...")
+        logger.debug("📤 准备发送企业微信消息: webhook={}...", target_webhook[:30])
         
         try:
             # 构建消息体
@@ -156,29 +190,28 @@ class NotificationService:
                     "content": message
                 }
             }
-            logger.debug(f"📝 企业微信消息体构建完成")
+            logger.debug("📝 企业微信消息体构建完成")
             
             # 发送请求
-            logger.debug(f"📡 发送企业微信HTTP请求...")
-            async with aiohttp.ClientSession() as session:
-                async with session.post(target_webhook, json=payload, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    logger.debug(f"📊 企业微信响应状态码: {resp.status}")
-                    result = await resp.json()
-                    logger.debug(f"📝 企业微信响应内容: {result}")
-                    if result.get('errcode') == 0:
-                        logger.info("✅ 企业微信消息发送成功")
-                        return True
-                    else:
-                        logger.error(f"❌ 企业微信消息发送失败: {result}")
-                        return False
+            logger.debug("📡 发送企业微信HTTP请求...")
+            async with self._get_session().post(target_webhook, json=payload, timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                logger.debug("📊 企业微信响应状态码: {}", resp.status)
+                result = await resp.json()
+                logger.debug("📝 企业微信响应内容: {}", result)
+                if result.get('errcode') == 0:
+                    logger.info("✅ 企业微信消息发送成功")
+                    return True
+                else:
+                    logger.error("❌ 企业微信消息发送失败: {}", result)
+                    return False
         
         except (aiohttp.ClientError, ValueError, KeyError) as e:
-            logger.error(f"❌ 企业微信推送异常: {e}")
+            logger.error("❌ 企业微信推送异常: {}", e)
             logger.exception(e)
             # 只记录日志，不抛出异常，防止主程序崩溃
             return False
         except Exception as e:
-            logger.error(f"❌ 企业微信推送未知异常: {e}")
+            logger.error("❌ 企业微信推送未知异常: {}", e)
             logger.exception(e)
             # 只记录日志，不抛出异常，防止主程序崩溃
             return False
@@ -243,7 +276,7 @@ class NotificationService:
         
         # 只推送配置中指定等级的信号
         if grade not in self.notify_grades:
-            logger.debug(f"信号等级 {grade} 不在推送列表中，跳过通知")
+            logger.debug("信号等级 {} 不在推送列表中，跳过通知", grade)
             return
         
         # 格式化消息
@@ -251,7 +284,7 @@ class NotificationService:
         
         # A+/A 级信号：立即推送 + @所有人
         if grade in ['A+', 'A']:
-            logger.info(f"📢 触发 {grade} 级信号，立即推送通知...")
+            logger.info("📢 触发 {} 级信号，立即推送通知...", grade)
             
             # 钉钉推送（@所有人）
             if self.enable_dingtalk:
@@ -269,7 +302,7 @@ class NotificationService:
                 'symbol': symbol,
                 'timestamp': time.time()
             })
-            logger.debug(f"B 级信号已加入汇总队列，当前队列长度: {len(self.pending_b_signals)}")
+            logger.debug("B 级信号已加入汇总队列，当前队列长度: {}", len(self.pending_b_signals))
             
             # 每 30 分钟汇总一次
             if time.time() - self.last_b_summary_time > 1800:  # 1800秒 = 30分钟
@@ -277,7 +310,7 @@ class NotificationService:
         
         # C 级信号：仅记录日志
         else:
-            logger.debug(f"C 级信号 [{symbol}] 仅记录日志，不推送通知")
+            logger.debug("C 级信号 [{}] 仅记录日志，不推送通知", symbol)
     
     async def _send_b_summary(self):
         """
@@ -310,7 +343,7 @@ class NotificationService:
         # 清空队列
         self.pending_b_signals = []
         self.last_b_summary_time = time.time()
-        logger.info(f"✅ B 级信号汇总已发送")
+        logger.info("✅ B 级信号汇总已发送")
     
 
     
@@ -400,7 +433,7 @@ class NotificationService:
 ---
 <font color='comment'>*Early Pump Detection*</font>
         """
-        logger.critical(f"🚀 触发主力拉盘警报 [{symbol}]，立即推送！")
+        logger.critical("🚀 触发主力拉盘警报 [{}]，立即推送！", symbol)
         
         # 优先发送到拉盘专用通道
         if self.enable_pump_channel:
@@ -422,22 +455,22 @@ class NotificationService:
 
 
 
-    async def send_realtime_pump_alert(self, data: Dict, is_strategy_learned: bool = False):
+    async def send_realtime_pump_alert(self, alert: PumpAlert, is_strategy_learned: bool = False):
         """
         发送实时拉盘警报 (WebSocket 实时监控)
         优先发送到拉盘专用通道，如果没有配置专用通道则发送到主通道
         
         Args:
-            data: 警报数据
+            alert: 警报数据
             is_strategy_learned: 是否是策略学习后的信号
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        symbol = data['symbol']
-        pct = data['change_pct']
-        vol = data['volume']
-        price = data['price']
-        is_closed = data['is_closed']
-        market_label = data.get('market_label', '现货')  # Default to spot if not provided
+        symbol = alert.symbol
+        pct = alert.change_pct
+        vol = alert.volume
+        price = alert.price
+        is_closed = alert.is_closed
+        market_label = alert.market_label
         
         status_emoji = "🔴" if is_closed else "⚡"
         status_text = "已收盘" if is_closed else "实时"
@@ -466,7 +499,7 @@ WebSocket 实时监控捕获，币种出现短时快速拉升，建议关注！
 ---
 <font color='comment'>*Realtime WebSocket Monitor - {market_label}*</font>
         """
-        logger.info(f"📢 触发实时拉盘警报 [{symbol} {market_label}]，推送通知...")
+        logger.info("📢 触发实时拉盘警报 [{} {}]，推送通知...", symbol, market_label)
         
         # 优先发送到拉盘专用通道
         if self.enable_pump_channel:
@@ -522,7 +555,7 @@ WebSocket 实时监控捕获，币种出现短时快速拉升，建议关注！
 ---
 <font color='comment'>*15m K线资金暴增监控*</font>
 """
-        logger.info(f"💰 触发15m资金暴增警报 [{symbol} {market_label}]，推送通知...")
+        logger.info("💰 触发15m资金暴增警报 [{} {}]，推送通知...", symbol, market_label)
 
         if self.enable_pump_channel:
             if self.pump_dingtalk_webhook:
@@ -586,7 +619,7 @@ WebSocket 实时监控捕获，币种出现短时快速拉升，建议关注！
 <font color='comment'>*Accumulation Detection*</font>
 """
 
-        logger.critical(f"🐋 触发庄家吸筹警报 [{symbol}] grade={grade}，推送通知...")
+        logger.critical("🐋 触发庄家吸筹警报 [{}] grade={}，推送通知...", symbol, grade)
 
         if self.enable_pump_channel:
             if self.pump_dingtalk_webhook:
@@ -655,7 +688,7 @@ WebSocket 实时监控捕获，币种出现短时快速拉升，建议关注！
         next_funding_time = funding_rate_data.get('next_funding_time')
         price = funding_rate_data.get('price')
         
-        logger.debug(f"📝 开始处理资金费率警报: {symbol}@{exchange}, 费率: {funding_rate:.4f}%, 阈值: {Config.FUNDING_RATE_THRESHOLD}%")
+        logger.debug("📝 开始处理资金费率警报: {}@{}, 费率: {:.4f}%, 阈值: {}%", symbol, exchange, funding_rate, Config.FUNDING_RATE_THRESHOLD)
         
         # 处理价格可能为None或非数字的情况
         try:
@@ -698,35 +731,35 @@ WebSocket 实时监控捕获，币种出现短时快速拉升，建议关注！
 ---
 <font color='comment'>*实时资金费率监控*</font>
         """
-        logger.info(f"⚡ 触发资金费率警报 [{symbol}]，推送通知...")
+        logger.info("⚡ 触发资金费率警报 [{}]，推送通知...", symbol)
         
         # 优先发送到资金费率专用通道
         if self.enable_funding_channel:
-            logger.debug(f"🔗 启用资金费率专用通道，dingtalk: {bool(self.funding_dingtalk_webhook)}, wechat: {bool(self.funding_wechat_webhook)}")
+            logger.debug("🔗 启用资金费率专用通道，dingtalk: {}, wechat: {}", bool(self.funding_dingtalk_webhook), bool(self.funding_wechat_webhook))
             if self.funding_dingtalk_webhook:
-                logger.debug(f"📤 通过资金费率专用钉钉通道发送: {self.funding_dingtalk_webhook[:30]}...")
+                logger.debug("📤 通过资金费率专用钉钉通道发送: {}...", self.funding_dingtalk_webhook[:30])
                 result = await self.send_dingtalk(
                     message, 
                     at_all=True, 
                     webhook=self.funding_dingtalk_webhook,
                     secret=self.funding_dingtalk_secret
                 )
-                logger.debug(f"✅ 资金费率专用钉钉通道发送结果: {result}")
+                logger.debug("✅ 资金费率专用钉钉通道发送结果: {}", result)
             if self.funding_wechat_webhook:
-                logger.debug(f"📤 通过资金费率专用微信通道发送: {self.funding_wechat_webhook[:30]}...")
+                logger.debug("📤 通过资金费率专用微信通道发送: {}...", self.funding_wechat_webhook[:30])
                 result = await self.send_wechat(message, webhook=self.funding_wechat_webhook)
-                logger.debug(f"✅ 资金费率专用微信通道发送结果: {result}")
+                logger.debug("✅ 资金费率专用微信通道发送结果: {}", result)
         else:
             # 如果没有配置专用通道，发送到主通道
-            logger.debug(f"🔗 未启用资金费率专用通道，使用主通道")
-            logger.debug(f"📤 主通道配置: dingtalk_enabled={self.enable_dingtalk}, wechat_enabled={self.enable_wechat}")
+            logger.debug("🔗 未启用资金费率专用通道，使用主通道")
+            logger.debug("📤 主通道配置: dingtalk_enabled={}, wechat_enabled={}", self.enable_dingtalk, self.enable_wechat)
             if self.enable_dingtalk:
-                logger.debug(f"📤 通过主钉钉通道发送")
+                logger.debug("📤 通过主钉钉通道发送")
                 result = await self.send_dingtalk(message, at_all=True)
-                logger.debug(f"✅ 主钉钉通道发送结果: {result}")
+                logger.debug("✅ 主钉钉通道发送结果: {}", result)
             if self.enable_wechat:
-                logger.debug(f"📤 通过主微信通道发送")
+                logger.debug("📤 通过主微信通道发送")
                 result = await self.send_wechat(message)
-                logger.debug(f"✅ 主微信通道发送结果: {result}")
-        logger.debug(f"📝 资金费率警报处理完成: {symbol}")
+                logger.debug("✅ 主微信通道发送结果: {}", result)
+        logger.debug("📝 资金费率警报处理完成: {}", symbol)
 
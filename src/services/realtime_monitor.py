@@ -1,15 +1,31 @@
 import asyncio
-import json
+import sys
 import aiohttp
 import websockets
 import websockets.exceptions
 from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, Any
+from operator import itemgetter
+from types import ModuleType
+from typing import Optional, Dict, Any, Callable, List, Set, Tuple
 from src.config import Config
+from src.models import PumpAlert
 from src.utils.logger import logger
 from src.services.notification import NotificationService
 
+# orjson 为 C 实现，解析 K线小消息比标准库 json 快约 3 倍（已列入 requirements.txt）
+import orjson
+
+# 可选依赖 pysimdjson：按需读取字段，不构建完整的 dict
+simdjson: Optional[ModuleType]
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# K线消息中 _process_kline 需要的字段：symbol, close, open, quote_volume, is_closed
+_KLINE_FIELDS = itemgetter('s', 'c', 'o', 'q', 'x')
+
 
 class RealtimeMonitor:
     """
@@ -28,21 +44,37 @@ class RealtimeMonitor:
         
         self.spot_symbols = []
         self.futures_symbols = []
+        # 预生成的 1m / 15m K线流名称，与 *_symbols 一一对应
+        self._spot_streams: List[str] = []
+        self._futures_streams: List[str] = []
+        self._spot_streams_15m: List[str] = []
+        self._futures_streams_15m: List[str] = []
         self.msg_count = 0
         self.notification_service = notification_service
         self.strategy = strategy  # 策略对象，用于判断是否是策略学习后的信号
         
-        # Config
+        # Config（设置 pump_threshold 时同步更新 _pump_factor）
         self.pump_threshold = Config.REALTIME_PUMP_THRESHOLD
         self.min_volume = Config.REALTIME_MIN_VOLUME
-        self.blacklist = Config.REALTIME_BLACKLIST
+        self.blacklist = frozenset(Config.REALTIME_BLACKLIST)
         
         self.enable_spot = Config.ENABLE_SPOT_MARKET
         self.enable_futures = Config.ENABLE_FUTURES_MARKET
+        # 市场类型 -> 展示用名称，避免告警/日志中重复分支和 upper()
+        self._market_meta = {
+            'spot': {'label': '现货', 'upper': 'SPOT'},
+            'futures': {'label': '永续合约', 'upper': 'FUTURES'},
+        }
         
         # Cooldown tracking (separate for spot/futures)
-        self.cooldowns = {}
+        # 双桶轮换：每 cooldown_sec 将当前桶转为上一桶，过期条目随旧桶整体丢弃，内存只保留两个窗口
+        self._cd_cur: Dict[Tuple[str, str], float] = {}
+        self._cd_prev: Dict[Tuple[str, str], float] = {}
+        self._cd_rot = 0.0
         self.cooldown_sec = 600  # 10 minutes
+        # 进行中的告警发送任务；信号量限制同时发送的通知数，突发行情下不会同时打满钉钉/Telegram
+        self._alert_tasks: Set[asyncio.Task] = set()
+        self._alert_sem = asyncio.Semaphore(max(Config.REALTIME_ALERT_MAX_CONCURRENT, 1))
 
         # 15m 资金暴增监控
         self.enable_15m_volume = Config.ENABLE_15M_VOLUME_MONITOR
@@ -57,44 +89,59 @@ class RealtimeMonitor:
         self.connection_stats = {}  # {chunk_id: {'last_message_time': float, 'message_count': int, 'reconnect_count': int}}
         self.health_check_interval = 60  # Check health every 60 seconds
 
-    async def get_spot_pairs(self):
+    @property
+    def pump_threshold(self) -> float:
+        """涨幅阈值 (%)"""
+        return self._pump_threshold
+
+    @pump_threshold.setter
+    def pump_threshold(self, value: float):
+        self._pump_threshold = value
+        # 预先换算为收盘价/开盘价的倍数，热路径只需一次乘法比较
+        self._pump_factor = 1.0 + value / 100.0
+
+    async def get_spot_pairs(self, session: aiohttp.ClientSession):
         """Fetch all SPOT USDT trading pairs from Binance."""
         if not self.enable_spot:
             return
             
         logger.info("正在获取币安现货 USDT 交易对...")
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.rest_url) as response:
-                    data = await response.json()
-                    self.spot_symbols = [
-                        s['symbol'].lower() for s in data['symbols']
-                        if s['symbol'].endswith('USDT')
-                           and s['status'] == 'TRADING'
-                           and s['symbol'] not in self.blacklist
-                    ]
-                    logger.info(f"✅ 现货监控: 成功获取 {len(self.spot_symbols)} 个交易对")
+            async with session.get(self.rest_url) as response:
+                data = await response.json(loads=orjson.loads)
+                self.spot_symbols = [
+                    s['symbol'].lower() for s in data['symbols']
+                    if s['symbol'].endswith('USDT')
+                       and s['status'] == 'TRADING'
+                       and s['symbol'] not in self.blacklist
+                ]
+                self._spot_streams = [f"{s}@kline_1m" for s in self.spot_symbols]
+                if self.enable_15m_volume:
+                    self._spot_streams_15m = [f"{s}@kline_15m" for s in self.spot_symbols]
+                logger.info(f"✅ 现货监控: 成功获取 {len(self.spot_symbols)} 个交易对")
         except Exception as e:
             logger.error(f"❌ 获取现货交易对失败: {e}")
 
-    async def get_futures_pairs(self):
+    async def get_futures_pairs(self, session: aiohttp.ClientSession):
         """Fetch all FUTURES USDT trading pairs from Binance."""
         if not self.enable_futures:
             return
             
         logger.info("正在获取币安永续合约 USDT 交易对...")
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.futures_rest_url) as response:
-                    data = await response.json()
-                    self.futures_symbols = [
-                        s['symbol'].lower() for s in data['symbols']
-                        if s['symbol'].endswith('USDT')
-                           and s['status'] == 'TRADING'
-                           and s['contractType'] == 'PERPETUAL'
-                           and s['symbol'] not in self.blacklist
-                    ]
-                    logger.info(f"✅ 合约监控: 成功获取 {len(self.futures_symbols)} 个交易对")
+            async with session.get(self.futures_rest_url) as response:
+                data = await response.json(loads=orjson.loads)
+                self.futures_symbols = [
+                    s['symbol'].lower() for s in data['symbols']
+                    if s['symbol'].endswith('USDT')
+                       and s['status'] == 'TRADING'
+                       and s['contractType'] == 'PERPETUAL'
+                       and s['symbol'] not in self.blacklist
+                ]
+                self._futures_streams = [f"{s}@kline_1m" for s in self.futures_symbols]
+                if self.enable_15m_volume:
+                    self._futures_streams_15m = [f"{s}@kline_15m" for s in self.futures_symbols]
+                logger.info(f"✅ 合约监控: 成功获取 {len(self.futures_symbols)} 个交易对")
         except Exception as e:
             logger.error(f"❌ 获取合约交易对失败: {e}")
 
@@ -119,40 +166,38 @@ class RealtimeMonitor:
 
     async def start(self):
         """Main entry point to start monitoring."""
-        await self.get_spot_pairs()
-        await self.get_futures_pairs()
+        # 两次 exchangeInfo 请求共享一个会话（复用 DNS 缓存），并发获取
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ttl_dns_cache=600)) as session:
+            await asyncio.gather(self.get_spot_pairs(session), self.get_futures_pairs(session))
         
         tasks = [self.stats_report()]
-        chunk_size = 200
+        # 每个连接订阅的流数量，需低于币安单连接 1024 个流的上限
+        chunk_size = Config.REALTIME_CHUNK_SIZE
 
         # Start SPOT WebSocket connections
         if self.enable_spot and self.spot_symbols:
-            for i in range(0, len(self.spot_symbols), chunk_size):
-                chunk = self.spot_symbols[i:i + chunk_size]
-                streams = "/".join([f"{s}@kline_1m" for s in chunk])
+            for i in range(0, len(self._spot_streams), chunk_size):
+                streams = "/".join(self._spot_streams[i:i + chunk_size])
                 url = f"{self.spot_ws_url}{streams}"
                 tasks.append(self._connect_socket(url, f"SPOT-{i // chunk_size}", 'spot'))
 
         # Start FUTURES WebSocket connections
         if self.enable_futures and self.futures_symbols:
-            for i in range(0, len(self.futures_symbols), chunk_size):
-                chunk = self.futures_symbols[i:i + chunk_size]
-                streams = "/".join([f"{s}@kline_1m" for s in chunk])
+            for i in range(0, len(self._futures_streams), chunk_size):
+                streams = "/".join(self._futures_streams[i:i + chunk_size])
                 url = f"{self.futures_ws_url}{streams}"
                 tasks.append(self._connect_socket(url, f"FUTURES-{i // chunk_size}", 'futures'))
 
         # Start 15m K线资金暴增监控 (合约 + 现货)
         if self.enable_15m_volume:
             if self.enable_spot and self.spot_symbols:
-                for i in range(0, len(self.spot_symbols), chunk_size):
-                    chunk = self.spot_symbols[i:i + chunk_size]
-                    streams = "/".join([f"{s}@kline_15m" for s in chunk])
+                for i in range(0, len(self._spot_streams_15m), chunk_size):
+                    streams = "/".join(self._spot_streams_15m[i:i + chunk_size])
                     url = f"{self.spot_ws_url}{streams}"
                     tasks.append(self._connect_15m_socket(url, f"15M-SPOT-{i // chunk_size}", 'spot'))
             if self.enable_futures and self.futures_symbols:
-                for i in range(0, len(self.futures_symbols), chunk_size):
-                    chunk = self.futures_symbols[i:i + chunk_size]
-                    streams = "/".join([f"{s}@kline_15m" for s in chunk])
+                for i in range(0, len(self._futures_streams_15m), chunk_size):
+                    streams = "/".join(self._futures_streams_15m[i:i + chunk_size])
                     url = f"{self.futures_ws_url}{streams}"
                     tasks.append(self._connect_15m_socket(url, f"15M-FUTURES-{i // chunk_size}", 'futures'))
 
@@ -167,7 +212,8 @@ class RealtimeMonitor:
             chunk_id: Chunk identifier for logging
             market_type: 'spot' or 'futures'
         """
-        logger.info(f"[实时监控] 正在连接 {market_type.upper()} 数据流 #{chunk_id}...")
+        market_tag = self._market_meta[market_type]['upper']
+        logger.info(f"[实时监控] 正在连接 {market_tag} 数据流 #{chunk_id}...")
         retry_delay = 5
         max_retry_delay = 60
         reconnect_count = 0
@@ -181,142 +227,198 @@ class RealtimeMonitor:
                 'reconnect_count': 0,
                 'last_health_check': 0
             }
+        # 本连接的统计字典绑定为局部变量，消息循环中不再经 self 和 conn_key 查找
+        stats = self.connection_stats[conn_key]
+        process_kline = self._process_kline
+        
+        # 每个连接复用一个 simdjson 解析器（构造时会分配较大的 tape 缓冲区）
+        # 解析器不能跨连接共享：上一条消息的文档对象存活时不能再次 parse
+        loads: Callable[..., Any] = simdjson.Parser().parse if simdjson is not None else orjson.loads
+        # 绑定一次事件循环时钟，每条消息只取一次时间
+        now_fn = asyncio.get_running_loop().time
         
         while True:
             try:
                 # Set connection timeout
+                # websockets 的后台读取任务负责接收并缓存到有界队列（max_queue），本循环只做解析和过滤；
+                # 队列满时停止读取 socket，由 TCP 流控形成背压
                 async with websockets.connect(
                     url,
                     ping_interval=30,
                     ping_timeout=15,
                     close_timeout=15,
-                    max_size=2**20
+                    max_size=2**20,
+                    max_queue=Config.REALTIME_WS_MAX_QUEUE
                 ) as websocket:
-                    logger.info(f"[实时监控] {market_type.upper()} #{chunk_id} 连接成功")
+                    logger.info(f"[实时监控] {market_tag} #{chunk_id} 连接成功")
                     reconnect_count = 0
                     retry_delay = 5  # Reset retry delay on successful connection
                     
                     # Update connection stats
-                    self.connection_stats[conn_key]['reconnect_count'] = reconnect_count
-                    self.connection_stats[conn_key]['last_message_time'] = asyncio.get_event_loop().time()
+                    stats['reconnect_count'] = reconnect_count
+                    stats['last_message_time'] = now_fn()
                     
+                    recv = websocket.recv
                     while True:
                         try:
-                            message = await asyncio.wait_for(websocket.recv(), timeout=45)  # 延长消息接收超时到45秒
+                            message = await asyncio.wait_for(recv(), timeout=45)  # 延长消息接收超时到45秒
                             self.msg_count += 1
+                            now = now_fn()
                             
                             # Update stats
-                            self.connection_stats[conn_key]['message_count'] += 1
-                            self.connection_stats[conn_key]['last_message_time'] = asyncio.get_event_loop().time()
+                            stats['message_count'] += 1
+                            stats['last_message_time'] = now
                             
-                            # 安全处理JSON数据
+                            # 安全处理JSON数据 (simdjson/orjson 的解码错误均为 ValueError 子类)
+                            # 只包住解码本身，_process_kline 中的数值转换错误不应记为无效JSON
                             try:
-                                data = json.loads(message)
-                                if 'data' in data:
-                                    await self._process_kline(data['data'], market_type)
-                            except json.JSONDecodeError:
-                                logger.debug(f"[实时监控] {market_type.upper()} #{chunk_id} 收到无效JSON数据，跳过处理")
+                                data = loads(message)
+                            except ValueError:
+                                logger.debug("[实时监控] {} #{} 收到无效JSON数据，跳过处理", market_tag, chunk_id)
                                 continue
+                            try:
+                                if 'data' in data:
+                                    process_kline(data['data'], market_type, now)
+                            finally:
+                                # 释放文档引用，simdjson 解析器才能解析下一条消息
+                                data = None
                                 
                         except asyncio.TimeoutError:
                             # No message received in 45 seconds, send ping to check connection
-                            logger.debug(f"[实时监控] {market_type.upper()} #{chunk_id} 45秒未收到消息，检查连接...")
+                            logger.debug("[实时监控] {} #{} 45秒未收到消息，检查连接...", market_tag, chunk_id)
                             try:
                                 pong_waiter = await websocket.ping()
                                 await asyncio.wait_for(pong_waiter, timeout=15)  # 延长Pong等待时间到15秒
                                 # Ping成功，更新时间戳
-                                self.connection_stats[conn_key]['last_message_time'] = asyncio.get_event_loop().time()
+                                stats['last_message_time'] = now_fn()
                             except Exception as ping_e:
-                                logger.warning(f"[实时监控] {market_type.upper()} #{chunk_id} Ping失败: {ping_e}，准备重连...")
+                                logger.warning(f"[实时监控] {market_tag} #{chunk_id} Ping失败: {ping_e}，准备重连...")
                                 break
                         except websockets.exceptions.ConnectionClosedOK:
-                            logger.info(f"[实时监控] {market_type.upper()} #{chunk_id} 正常关闭，准备重连...")
+                            logger.info(f"[实时监控] {market_tag} #{chunk_id} 正常关闭，准备重连...")
                             break
                         except websockets.exceptions.ConnectionClosedError:
-                            logger.warning(f"[实时监控] {market_type.upper()} #{chunk_id} 连接异常关闭，准备重连...")
+                            logger.warning(f"[实时监控] {market_tag} #{chunk_id} 连接异常关闭，准备重连...")
                             break
             except websockets.exceptions.ConnectionClosed as e:
                 reconnect_count += 1
-                self.connection_stats[conn_key]['reconnect_count'] = reconnect_count
-                logger.warning(f"[实时监控] {market_type.upper()} #{chunk_id} 连接关闭，{retry_delay}秒后重连 (重连次数: {reconnect_count})...")
+                stats['reconnect_count'] = reconnect_count
+                logger.warning(f"[实时监控] {market_tag} #{chunk_id} 连接关闭，{retry_delay}秒后重连 (重连次数: {reconnect_count})...")
                 await asyncio.sleep(retry_delay)
                 retry_delay = min(retry_delay * 1.5, max_retry_delay)  # 放缓重连增长速度
                 
             except websockets.exceptions.InvalidStatusCode as e:
                 reconnect_count += 1
-                self.connection_stats[conn_key]['reconnect_count'] = reconnect_count
-                logger.error(f"[实时监控] {market_type.upper()} #{chunk_id} 连接状态码错误: {e.status_code}，{retry_delay * 2}秒后重连 (重连次数: {reconnect_count})...")
+                stats['reconnect_count'] = reconnect_count
+                logger.error(f"[实时监控] {market_tag} #{chunk_id} 连接状态码错误: {e.status_code}，{retry_delay * 2}秒后重连 (重连次数: {reconnect_count})...")
                 await asyncio.sleep(retry_delay * 2)  # 状态码错误使用更长延迟
                 retry_delay = min(retry_delay * 2, max_retry_delay)
                 
             except (asyncio.TimeoutError, TimeoutError) as e:
                 reconnect_count += 1
-                self.connection_stats[conn_key]['reconnect_count'] = reconnect_count
-                logger.error(f"[实时监控] {market_type.upper()} #{chunk_id} 连接超时: {e}，{retry_delay * 1.5}秒后重连 (重连次数: {reconnect_count})...")
+                stats['reconnect_count'] = reconnect_count
+                logger.error(f"[实时监控] {market_tag} #{chunk_id} 连接超时: {e}，{retry_delay * 1.5}秒后重连 (重连次数: {reconnect_count})...")
                 await asyncio.sleep(retry_delay * 1.5)  # 超时错误使用更长延迟
                 retry_delay = min(retry_delay * 1.5, max_retry_delay)
                 
             except Exception as e:
                 reconnect_count += 1
-                self.connection_stats[conn_key]['reconnect_count'] = reconnect_count
-                logger.error(f"[实时监控] {market_type.upper()} #{chunk_id} 连接异常: {e}，{retry_delay}秒后重连 (重连次数: {reconnect_count})...")
+                stats['reconnect_count'] = reconnect_count
+                logger.error(f"[实时监控] {market_tag} #{chunk_id} 连接异常: {e}，{retry_delay}秒后重连 (重连次数: {reconnect_count})...")
                 await asyncio.sleep(retry_delay)
                 retry_delay = min(retry_delay * 1.5, max_retry_delay)  # 放缓重连增长速度
 
-    async def _process_kline(self, data, market_type):
-        """Process incoming kline data."""
-        k = data['k']
-        symbol = k['s']
-        close_price = float(k['c'])
-        open_price = float(k['o'])
-        quote_volume = float(k['q'])
-        is_closed = k['x']
-
+    def _process_kline(self, data, market_type, now):
+        """
+        Process incoming kline data.
+        
+        同步执行：绝大多数消息不触发告警，无需创建协程；触发时告警以后台任务发送，不阻塞接收循环。
+        now 为调用方已获取的事件循环时间，避免每条消息重复取时钟。
+        data 可以是 dict，也可以是 simdjson 的惰性对象：只读取 k 中的 s/c/o/q/x
+        五个字段，不调用 as_dict()。该对象不能存活到同一连接的下一次 parse。
+        """
+        # 一次取出所需字段；Binance 的价格/成交额是 JSON 字符串，只在需要时转 float
+        symbol, close_raw, open_raw, quote_raw, is_closed = _KLINE_FIELDS(data['k'])
+        open_price = float(open_raw)
         if open_price <= 0:
             return
 
-        change_pct = ((close_price - open_price) / open_price) * 100
+        # Trigger condition：close >= open * (1 + 阈值/100)，等价于涨幅 >= 阈值但无需除法
+        # （绝大多数消息在此返回，不再解析成交额、不访问冷却表）
+        close_price = float(close_raw)
+        if close_price < open_price * self._pump_factor:
+            return
+        quote_volume = float(quote_raw)
+        if quote_volume < self.min_volume:
+            return
+
+        cooldown_sec = self.cooldown_sec
 
         # Check cooldown (separate for spot/futures)
-        cooldown_key = f"{market_type}:{symbol}"
-        now = asyncio.get_event_loop().time()
-        if cooldown_key in self.cooldowns:
-            if now - self.cooldowns[cooldown_key] < self.cooldown_sec:
-                return
+        if now - self._cd_rot >= cooldown_sec:
+            self._cd_prev = self._cd_cur
+            self._cd_cur = {}
+            self._cd_rot = now
+        cd_cur = self._cd_cur
+        # 元组键避免每次拼接字符串；market_type 为字面量，symbol 驻留后跨消息复用同一对象
+        cooldown_key = (market_type, sys.intern(symbol))
+        last = cd_cur.get(cooldown_key)
+        if last is None:
+            last = self._cd_prev.get(cooldown_key, float('-inf'))
+        if now - last < cooldown_sec:
+            return
 
-        # Trigger condition
-        if change_pct >= self.pump_threshold and quote_volume >= self.min_volume:
-            self.cooldowns[cooldown_key] = now
-            await self._trigger_alert(symbol, change_pct, quote_volume, close_price, is_closed, market_type)
+        cd_cur[cooldown_key] = now
+        # 涨幅只在触发告警时计算
+        change_pct = ((close_price - open_price) / open_price) * 100
+        task = asyncio.create_task(
+            self._trigger_alert(symbol, change_pct, quote_volume, close_price, is_closed, market_type)
+        )
+        # 保留任务引用，防止任务在完成前被回收
+        self._alert_tasks.add(task)
+        task.add_done_callback(self._on_alert_done)
+
+    def _on_alert_done(self, task: asyncio.Task):
+        """告警任务结束回调：释放引用并记录异常（否则只会在回收时报 never retrieved）"""
+        self._alert_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.opt(exception=exc).error(f"[实时监控] 告警发送失败: {exc}")
 
     async def _trigger_alert(self, symbol, change, volume, price, is_closed, market_type):
         """Send alert notification."""
         status = "🔴 已收盘" if is_closed else "⚡ 实时"
-        market_label = "现货" if market_type == 'spot' else "永续合约"
+        market_label = self._market_meta[market_type]['label']
         
         logger.critical(f"🚀 [{market_label}] {symbol} {status} | 涨幅: +{change:.2f}% | 成交: ${volume:,.0f}")
         
         if self.notification_service:
-            data = {
-                'symbol': symbol,
-                'change_pct': change,
-                'volume': volume,
-                'price': price,
-                'is_closed': is_closed,
-                'market_type': market_type,
-                'market_label': market_label
-            }
+            alert = PumpAlert(
+                symbol=symbol,
+                change_pct=change,
+                volume=volume,
+                price=price,
+                is_closed=is_closed,
+                market_type=market_type,
+                market_label=market_label
+            )
             is_strategy_learned = hasattr(self.strategy, 'is_strategy_learned') and self.strategy.is_strategy_learned
-            await self.notification_service.send_realtime_pump_alert(data, is_strategy_learned=is_strategy_learned)
+            async with self._alert_sem:
+                await self.notification_service.send_realtime_pump_alert(alert, is_strategy_learned=is_strategy_learned)
 
     async def _connect_15m_socket(self, url, chunk_id, market_type):
         """
         连接 15m K线 WebSocket 流，检测资金暴增。
         """
-        logger.info(f"[15m资金监控] 正在连接 {market_type.upper()} 数据流 #{chunk_id}...")
+        market_tag = self._market_meta[market_type]['upper']
+        logger.info(f"[15m资金监控] 正在连接 {market_tag} 数据流 #{chunk_id}...")
         retry_delay = 5
         max_retry_delay = 60
         reconnect_count = 0
+        # 与 1m 连接相同：每个连接独立的 simdjson 解析器，未安装时使用 orjson
+        loads: Callable[..., Any] = simdjson.Parser().parse if simdjson is not None else orjson.loads
 
         while True:
             try:
@@ -325,9 +427,10 @@ class RealtimeMonitor:
                     ping_interval=30,
                     ping_timeout=15,
                     close_timeout=15,
-                    max_size=2**20
+                    max_size=2**20,
+                    max_queue=Config.REALTIME_WS_MAX_QUEUE
                 ) as websocket:
-                    logger.info(f"[15m资金监控] {market_type.upper()} #{chunk_id} 连接成功")
+                    logger.info(f"[15m资金监控] {market_tag} #{chunk_id} 连接成功")
                     reconnect_count = 0
                     retry_delay = 5
 
@@ -335,11 +438,14 @@ class RealtimeMonitor:
                         try:
                             message = await asyncio.wait_for(websocket.recv(), timeout=120)
                             try:
-                                data = json.loads(message)
+                                data = loads(message)
+                            except ValueError:
+                                continue
+                            try:
                                 if 'data' in data:
                                     await self._process_15m_kline(data['data'], market_type)
-                            except json.JSONDecodeError:
-                                continue
+                            finally:
+                                data = None
                         except asyncio.TimeoutError:
                             try:
                                 pong_waiter = await websocket.ping()
@@ -347,19 +453,19 @@ class RealtimeMonitor:
                             except Exception:
                                 break
                         except websockets.exceptions.ConnectionClosedOK:
-                            logger.info(f"[15m资金监控] {market_type.upper()} #{chunk_id} 正常关闭，准备重连...")
+                            logger.info(f"[15m资金监控] {market_tag} #{chunk_id} 正常关闭，准备重连...")
                             break
                         except websockets.exceptions.ConnectionClosedError:
-                            logger.warning(f"[15m资金监控] {market_type.upper()} #{chunk_id} 连接异常关闭，准备重连...")
+                            logger.warning(f"[15m资金监控] {market_tag} #{chunk_id} 连接异常关闭，准备重连...")
                             break
             except websockets.exceptions.ConnectionClosed as e:
                 reconnect_count += 1
-                logger.warning(f"[15m资金监控] {market_type.upper()} #{chunk_id} 连接关闭，{retry_delay}秒后重连 (重连次数: {reconnect_count})...")
+                logger.warning(f"[15m资金监控] {market_tag} #{chunk_id} 连接关闭，{retry_delay}秒后重连 (重连次数: {reconnect_count})...")
                 await asyncio.sleep(retry_delay)
                 retry_delay = min(retry_delay * 1.5, max_retry_delay)
             except Exception as e:
                 reconnect_count += 1
-                logger.error(f"[15m资金监控] {market_type.upper()} #{chunk_id} 连接异常: {e}，{retry_delay}秒后重连 (重连次数: {reconnect_count})...")
+                logger.error(f"[15m资金监控] {market_tag} #{chunk_id} 连接异常: {e}，{retry_delay}秒后重连 (重连次数: {reconnect_count})...")
                 await asyncio.sleep(retry_delay)
                 retry_delay = min(retry_delay * 1.5, max_retry_delay)
 
@@ -367,19 +473,19 @@ class RealtimeMonitor:
         """
         检测 15m K线的资金暴增情况。
         只处理已收盘的 K线，比较当前成交量与历史均值的比值。
+        data 可以是 dict 或 simdjson 惰性对象，只读取 k 中所需字段。
         """
-        k = data['k']
-        symbol = k['s']
-        quote_volume = float(k['q'])
-        close_price = float(k['c'])
-        open_price = float(k['o'])
-        is_closed = k['x']
+        symbol, close_raw, open_raw, quote_raw, is_closed = _KLINE_FIELDS(data['k'])
 
+        # 未收盘K线占绝大多数，先判断再转换数值
         if not is_closed:
             return
 
+        open_price = float(open_raw)
         if open_price <= 0:
             return
+        close_price = float(close_raw)
+        quote_volume = float(quote_raw)
 
         change_pct = ((close_price - open_price) / open_price) * 100
 
@@ -413,7 +519,7 @@ class RealtimeMonitor:
         """
         触发资金暴增告警。
         """
-        market_label = "现货" if market_type == 'spot' else "永续合约"
+        market_label = self._market_meta[market_type]['label']
         direction = "📈" if change_pct > 0 else "📉"
         logger.critical(
             f"💰 [15m资金暴增] [{market_label}] {symbol} {direction} | "
@@ -1,7 +1,7 @@
 import asyncio
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from src.config import Config
-from src.backtest import Backtester
+from src.backtest import Backtester, build_param_combinations
 from src.strategies.entry_exit import EntryExitStrategy
 from src.connectors.binance import BinanceConnector
 from src.utils.logger import logger
@@ -10,9 +10,23 @@ from src.utils.logger import logger
 class StrategyLearner:
     """策略学习器，自动优化策略参数"""
     
-    def __init__(self):
-        self.best_strategies = {}
-        self.connector = None
+    PARAM_GRID = {
+        'min_total_flow': [10000, 50000, 100000],  # 降低资金流阈值，适应1分钟K线
+        'min_ratio': [1.2, 1.5, 2.0],  # 增加更低的买卖比
+        'atr_sl_mult': [1.0, 1.5, 2.0],  # 增加更多ATR止损倍数
+        'atr_tp_mult': [1.5, 2.0, 2.5],  # 增加更多ATR止盈倍数
+        'min_consensus_bars': [1, 2]  # 减少共识K线数要求
+    }
+    
+    def __init__(self, connector: Optional[BinanceConnector] = None):
+        """
+        Args:
+            connector: 调用方已初始化的连接器（可选），传入时复用且不负责关闭
+        """
+        self.best_strategies: Dict[str, Dict[str, Any]] = {}
+        self.connector = connector
+        # 参数组合与品种无关，构造时生成一次，所有品种的网格搜索共用
+        self._param_combos = build_param_combinations(self.PARAM_GRID)
     
     async def learn(self, symbols: List[str] = None, days: int = 7) -> Dict:
         """学习最优策略
@@ -29,53 +43,36 @@ class StrategyLearner:
         if not symbols:
             symbols = self._get_top_volume_symbols(limit=10)
         
-        param_grid = {
-            'min_total_flow': [10000, 50000, 100000],  # 降低资金流阈值，适应1分钟K线
-            'min_ratio': [1.2, 1.5, 2.0],  # 增加更低的买卖比
-            'atr_sl_mult': [1.0, 1.5, 2.0],  # 增加更多ATR止损倍数
-            'atr_tp_mult': [1.5, 2.0, 2.5],  # 增加更多ATR止盈倍数
-            'min_consensus_bars': [1, 2]  # 减少共识K线数要求
-        }
-        
-        all_results = []
-        completed = 0
         total = len(symbols)
         
         logger.info(f"将回测 {total} 个品种，请稍候...")
         
-        # 初始化连接器并复用
-        self.connector = BinanceConnector()
-        await self.connector.initialize()
-        await self.connector.exchange.load_markets()
-        logger.info("✅ Binance 连接已建立，将复用此连接")
+        # 初始化连接器并复用（ccxt.async_support 支持并发请求）；已注入时跳过 load_markets
+        owns_connector = self.connector is None
+        if owns_connector:
+            connector = BinanceConnector()
+            await connector.initialize()
+            exchange = connector.exchange
+            if exchange is None:
+                raise RuntimeError("Binance 连接初始化失败")
+            await exchange.load_markets()
+            self.connector = connector
+            logger.info("✅ Binance 连接已建立，将复用此连接")
         
-        for symbol in symbols:
-            try:
-                cleaned_symbol = symbol.split(':')[0]
-                completed += 1
-                logger.info(f"回测 [{completed}/{total}]: {cleaned_symbol}...")
-                
-                bt = Backtester(cleaned_symbol, days, connector=self.connector)
-                await bt.prepare_data_v2()
-                result = bt.grid_search(param_grid)
-                
-                if result['best_params']:
-                    result['symbol'] = cleaned_symbol
-                    all_results.append(result)
-                    logger.info(f"  ✅ {cleaned_symbol}: 胜率 {result['best_results']['winrate']:.2%}")
-            except Exception as e:
-                error_msg = str(e)
-                if "Invalid symbol" in error_msg or "Invalid symbol." in error_msg:
-                    logger.warning(f"  ⚠️  {cleaned_symbol}: 无效符号")
-                else:
-                    logger.error(f"  ❌ {cleaned_symbol}: {e}")
-            
-            # 添加请求间隔控制，避免短时间内发送过多请求
-            await asyncio.sleep(Config.RATE_LIMIT_DELAY)
-        
-        if self.connector:
-            await self.connector.close()
-            self.connector = None
+        # 有界并发：数据准备（网络 I/O）相互重叠，0 表示不限制
+        limit = Config.STRATEGY_LEARNING_MAX_CONCURRENT or total
+        sem = asyncio.Semaphore(max(limit, 1))
+        try:
+            results = await asyncio.gather(
+                *(self._learn_symbol(symbol, days, sem, i + 1, total)
+                  for i, symbol in enumerate(symbols)),
+                return_exceptions=True
+            )
+        finally:
+            if owns_connector and self.connector:
+                await self.connector.close()
+                self.connector = None
+        all_results = [r for r in results if isinstance(r, dict)]
         
         if all_results:
             # 按胜率排序所有结果
@@ -139,6 +136,34 @@ class StrategyLearner:
         
         return self.best_strategies
     
+    async def _learn_symbol(self, symbol: str, days: int, sem: asyncio.Semaphore,
+                            index: int, total: int) -> Optional[Dict]:
+        """回测单个品种并返回网格搜索结果，失败或无有效参数时返回 None"""
+        cleaned_symbol = symbol.split(':')[0]
+        async with sem:
+            try:
+                logger.info(f"回测 [{index}/{total}]: {cleaned_symbol}...")
+                
+                bt = Backtester(cleaned_symbol, days, connector=self.connector)
+                await bt.prepare_data_v2()
+                result = bt.grid_search(self.PARAM_GRID, self._param_combos)
+                
+                if result['best_params']:
+                    result['symbol'] = cleaned_symbol
+                    logger.info(f"  ✅ {cleaned_symbol}: 胜率 {result['best_results']['winrate']:.2%}")
+                    return result
+                return None
+            except Exception as e:
+                error_msg = str(e)
+                if "Invalid symbol" in error_msg or "Invalid symbol." in error_msg:
+                    logger.warning(f"  ⚠️  {cleaned_symbol}: 无效符号")
+                else:
+                    logger.error(f"  ❌ {cleaned_symbol}: {e}")
+                return None
+            finally:
+                # 添加请求间隔控制，避免短时间内发送过多请求
+                await asyncio.sleep(Config.RATE_LIMIT_DELAY)
+    
     def _get_top_volume_symbols(self, limit: int = 10) -> List[str]:
         return ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'BNB/USDT', 'XRP/USDT',
                 'DOGE/USDT', 'ADA/USDT', 'DOT/USDT', 'LINK/USDT', 'MATIC/USDT']
@@ -1,5 +1,6 @@
 import asyncio
-from typing import List, Dict
+import numpy as np
+from typing import List, Dict, Optional, Tuple
 from src.connectors.binance import BinanceConnector
 from src.processors.data_processor import DataProcessor
 from src.strategies.entry_exit import EntryExitStrategy
@@ -10,13 +11,15 @@ from src.utils.logger import logger
 class SymbolSelector:
     """品种筛选器，使用最优策略筛选可交易品种"""
     
-    def __init__(self, strategy: EntryExitStrategy):
+    def __init__(self, strategy: EntryExitStrategy, connector: Optional[BinanceConnector] = None):
         """初始化品种筛选器
         
         Args:
             strategy: 用于筛选的策略对象
+            connector: 调用方已初始化的连接器（可选），传入时复用且不负责关闭
         """
         self.strategy = strategy
+        self.connector = connector
     
     async def select_symbols(self, symbols: List[str]) -> List[str]:
         """使用最优策略筛选可交易品种
@@ -30,9 +33,10 @@ class SymbolSelector:
         logger.info(f"开始筛选可交易品种，共 {len(symbols)} 个...")
         selected = []
         
-        # 初始化连接器，添加重试机制
-        connector = None
-        max_retries = 3
+        # 优先复用注入的连接器，否则自行初始化（添加重试机制）
+        connector = self.connector
+        owns_connector = connector is None
+        max_retries = 3 if owns_connector else 0
         retry_delay = 2  # 秒
         
         for attempt in range(max_retries):
@@ -55,51 +59,15 @@ class SymbolSelector:
             # 修复符号格式，移除冒号并转换为正确格式
             cleaned_symbols = [symbol.split(':')[0] for symbol in symbols]  # 移除 :USDT 后缀
             
-            # 批量获取数据，添加请求间隔控制
-            for i, cleaned_symbol in enumerate(cleaned_symbols):
-                try:
-                    logger.debug(f"  获取 {cleaned_symbol} 数据...")
-                    
-                    # 获取最新数据（50根1分钟K线）
-                    candles = await connector.fetch_standard_candles(cleaned_symbol, limit=50)
-                    if not candles or len(candles) < 50:
-                        logger.debug(f"  {cleaned_symbol}: 数据不足，跳过")
-                        continue
-                    
-                    # 处理数据
-                    df = DataProcessor.process_candles(candles)
-                    
-                    # 计算指标（模拟现有策略的指标计算）
-                    metrics = self._calculate_metrics(df)
-                    
-                    # 评估策略
-                    platform_metrics = {'binance': metrics}
-                    consensus = "看涨" if metrics['cumulative_net_flow'] > Config.STRATEGY_MIN_TOTAL_FLOW else "看跌"
-                    signals = []
-                    
-                    # 使用最优策略评估
-                    result = self.strategy.evaluate(
-                        platform_metrics, 
-                        consensus, 
-                        signals, 
-                        cleaned_symbol
-                    )
-                    
-                    # 如果策略建议入场，添加到选中列表
-                    if result['action'] == 'ENTRY':
-                        selected.append(cleaned_symbol)
-                        logger.info(f"  ✅ {cleaned_symbol}: 符合交易条件")
-                    else:
-                        logger.debug(f"  ❌ {cleaned_symbol}: 不符合交易条件")
-                except Exception as e:
-                    logger.error(f"  ⚠️  筛选 {cleaned_symbol} 失败: {e}")
-                
-                # 添加请求间隔控制，避免短时间内发送过多请求
-                # 最后一个符号不需要等待
-                if i < len(cleaned_symbols) - 1:
-                    await asyncio.sleep(Config.RATE_LIMIT_DELAY * 2)  # 增加间隔，降低请求频率
+            # 有界并发：同时最多 SYMBOL_SELECTION_MAX_CONCURRENT 个请求在途
+            sem = asyncio.Semaphore(Config.SYMBOL_SELECTION_MAX_CONCURRENT)
+            results = await asyncio.gather(
+                *(self._evaluate_symbol(connector, s, sem) for s in cleaned_symbols),
+                return_exceptions=True
+            )
+            selected = [r for r in results if isinstance(r, str)]
         finally:
-            if connector:
+            if owns_connector and connector:
                 try:
                     await connector.close()
                     logger.info("✅ 已关闭连接器")
@@ -109,11 +77,55 @@ class SymbolSelector:
         logger.info(f"品种筛选完成！共选中 {len(selected)} 个品种")
         return selected
     
-    def _calculate_metrics(self, df) -> Dict:
+    async def _evaluate_symbol(self, connector, cleaned_symbol: str, sem: asyncio.Semaphore) -> Optional[str]:
+        """获取单个品种数据并评估，符合交易条件时返回品种名，否则返回 None"""
+        async with sem:
+            try:
+                logger.debug(f"  获取 {cleaned_symbol} 数据...")
+                
+                # 获取最新数据（50根1分钟K线）
+                candles = await connector.fetch_standard_candles(cleaned_symbol, limit=50)
+                if not candles or len(candles) < 50:
+                    logger.debug(f"  {cleaned_symbol}: 数据不足，跳过")
+                    return None
+                
+                # 处理数据（只需几个标量指标，直接使用 NumPy 数组，不构建 DataFrame）
+                arrays = DataProcessor.process_candles_np(candles)
+                
+                # 计算指标（模拟现有策略的指标计算）
+                metrics = self._calculate_metrics(arrays)
+                
+                # 评估策略
+                platform_metrics = {'binance': metrics}
+                consensus = "看涨" if metrics['cumulative_net_flow'] > Config.STRATEGY_MIN_TOTAL_FLOW else "看跌"
+                signals = []
+                
+                # 使用最优策略评估
+                result = self.strategy.evaluate(
+                    platform_metrics, 
+                    consensus, 
+                    signals, 
+                    cleaned_symbol
+                )
+                
+                # 如果策略建议入场，返回该品种
+                if result['action'] == 'ENTRY':
+                    logger.info(f"  ✅ {cleaned_symbol}: 符合交易条件")
+                    return cleaned_symbol
+                logger.debug(f"  ❌ {cleaned_symbol}: 不符合交易条件")
+                return None
+            except Exception as e:
+                logger.error(f"  ⚠️  筛选 {cleaned_symbol} 失败: {e}")
+                return None
+            finally:
+                # 在信号量内保留请求间隔，控制 Binance 请求权重
+                await asyncio.sleep(Config.RATE_LIMIT_DELAY * 2)
+    
+    def _calculate_metrics(self, arrays: Tuple[np.ndarray, ...]) -> Dict:
         """计算品种的关键指标
         
         Args:
-            df: 品种的K线数据
+            arrays: DataProcessor.process_candles_np 返回的 (open, high, low, close, volume)
             
         Returns:
             Dict: 计算后的指标
@@ -123,29 +135,37 @@ class SymbolSelector:
         metrics = {
             'cumulative_net_flow': 0.0,
             'buy_sell_ratio': 1.0,
-            'current_price': df['close'].iloc[-1] if not df.empty else 0.0,
-            'support_low': df['low'].min() if not df.empty else 0.0,
-            'resistance_high': df['high'].max() if not df.empty else 0.0,
+            'current_price': 0.0,
+            'support_low': 0.0,
+            'resistance_high': 0.0,
             'atr': 0.0
         }
+        open_, high, low, close, volume = arrays
+        if len(close) == 0:
+            return metrics
+        
+        last_close = close[-1]
+        
+        metrics['current_price'] = last_close
+        metrics['support_low'] = low.min()
+        metrics['resistance_high'] = high.max()
         
         # 计算ATR（平均真实波动幅度）
-        if len(df) >= 14:
-            # 简单ATR计算
-            tr = df['high'] - df['low']
-            metrics['atr'] = tr.rolling(window=14).mean().iloc[-1]
+        if len(close) >= 14:
+            # 简单ATR计算：最近14根K线 high-low 的均值
+            metrics['atr'] = (high[-14:] - low[-14:]).mean()
         
         # 计算简单的资金流向和买卖比率
-        if len(df) >= 10:
-            # 假设最近10根K线的上涨成交量为买入，下跌成交量为卖出
-            buy_vol = df['volume'][(df['close'] > df['open'])].sum()
-            sell_vol = df['volume'][(df['close'] <= df['open'])].sum()
+        if len(close) >= 10:
+            # 上涨K线的成交量视为买入，其余视为卖出
+            buy_vol = volume[close > open_].sum()
+            sell_vol = volume.sum() - buy_vol
             
             # 计算买卖比率
             if sell_vol > 0:
                 metrics['buy_sell_ratio'] = buy_vol / sell_vol
             
             # 计算资金流向
-            metrics['cumulative_net_flow'] = (buy_vol - sell_vol) * df['close'].iloc[-1]
+            metrics['cumulative_net_flow'] = (buy_vol - sell_vol) * last_close
         
         return metrics
@@ -1,18 +1,38 @@
 import os
-import json
 import sqlite3
+import threading
 import time
-from typing import Dict
+from typing import Dict, List
+
+import orjson
+
+
+def _dumps_metrics(platform_metrics: Dict) -> str:
+    """序列化指标字典（orjson 为 C 实现，直接支持 numpy 数值）
+
+    注意：NaN/Infinity 写为 null，早于 orjson 的行由 json.dumps 写为 NaN。
+    """
+    return orjson.dumps(
+        platform_metrics,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ).decode('utf-8')
+
 
 class Persistence:
     def __init__(self, db_path: str):
         self.db_path = db_path
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        self.conn = sqlite3.connect(db_path)
+        # 单连接在多个 asyncio 任务/线程间复用，写操作由锁串行化
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
         self._init_schema()
 
     def _init_schema(self):
         cur = self.conn.cursor()
+        # WAL + synchronous=NORMAL：提交时不再每次 fsync 主库文件
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA temp_store=MEMORY")
         cur.execute("""
         CREATE TABLE IF NOT EXISTS signals (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -42,34 +62,46 @@ class Persistence:
         """)
         self.conn.commit()
 
-    def save_signal(self, signal: Dict, platform_metrics: Dict, symbol: str):
-        cur = self.conn.cursor()
-        ts = int(time.time())
-        metrics_json = json.dumps(platform_metrics, ensure_ascii=False)
-        cur.execute("""
+    _INSERT_SIGNAL = """
         INSERT INTO signals (ts, symbol, grade, type, desc, metrics_json)
         VALUES (?, ?, ?, ?, ?, ?)
-        """, (ts, symbol, signal.get('grade'), signal.get('type'), signal.get('desc'), metrics_json))
-        self.conn.commit()
+        """
+
+    def save_signal(self, signal: Dict, platform_metrics: Dict, symbol: str):
+        self.save_signals_many([signal], platform_metrics, symbol)
+
+    def save_signals_many(self, signals: List[Dict], platform_metrics: Dict, symbol: str):
+        """批量写入同一品种的多个信号，一次 executemany + 一次 commit"""
+        if not signals:
+            return
+        ts = int(time.time())
+        metrics_json = _dumps_metrics(platform_metrics)
+        rows = [
+            (ts, symbol, signal.get('grade'), signal.get('type'), signal.get('desc'), metrics_json)
+            for signal in signals
+        ]
+        with self._lock:
+            self.conn.executemany(self._INSERT_SIGNAL, rows)
+            self.conn.commit()
 
     def save_recommendation(self, rec: Dict, platform_metrics: Dict):
-        cur = self.conn.cursor()
         ts = int(time.time())
-        metrics_json = json.dumps(platform_metrics, ensure_ascii=False)
-        cur.execute("""
-        INSERT INTO recommendations (ts, symbol, action, side, price, stop_loss, take_profit, notional_usd, size_base, reason, metrics_json)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            ts,
-            rec.get('symbol'),
-            rec.get('action'),
-            rec.get('side'),
-            rec.get('price'),
-            rec.get('stop_loss'),
-            rec.get('take_profit'),
-            rec.get('notional_usd'),
-            rec.get('size_base'),
-            rec.get('reason'),
-            metrics_json
-        ))
-        self.conn.commit()
+        metrics_json = _dumps_metrics(platform_metrics)
+        with self._lock:
+            self.conn.execute("""
+            INSERT INTO recommendations (ts, symbol, action, side, price, stop_loss, take_profit, notional_usd, size_base, reason, metrics_json)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                ts,
+                rec.get('symbol'),
+                rec.get('action'),
+                rec.get('side'),
+                rec.get('price'),
+                rec.get('stop_loss'),
+                rec.get('take_profit'),
+                rec.get('notional_usd'),
+                rec.get('size_base'),
+                rec.get('reason'),
+                metrics_json
+            ))
+            self.conn.commit()
@@ -1,8 +1,36 @@
 from typing import Dict, List
 import numpy as np
-import pandas as pd
 import time
 from src.config import Config
+from src.utils.position_manager import PositionManager
+from src.utils.logger import logger
+
+# 视为强信号的等级
+_STRONG_GRADES = frozenset(('A+', 'A'))
+
+# 仓位管理器单例：配置只在首次使用时读取一次，避免每次 compute_position 重复初始化
+_position_manager = None
+
+
+def _get_position_manager() -> PositionManager:
+    global _position_manager
+    if _position_manager is None:
+        _position_manager = PositionManager()  # 会自动读取 Config 配置
+    return _position_manager
+
+
+def _median_small(vals: List[float]) -> float:
+    """小列表中位数（会原地排序 vals），空列表返回 0.0"""
+    n = len(vals)
+    if n == 0:
+        return 0.0
+    if n == 1:
+        return vals[0]
+    if n == 2:
+        return (vals[0] + vals[1]) * 0.5
+    vals.sort()
+    half = n // 2
+    return vals[half] if n % 2 else (vals[half - 1] + vals[half]) * 0.5
 
 class EntryExitStrategy:
     def __init__(self, min_total_flow: float = None, min_ratio: float = None, 
@@ -17,81 +45,49 @@ class EntryExitStrategy:
         self.require_midband = require_midband if require_midband is not None else getattr(Config, 'STRATEGY_REQUIRE_MIDBAND', True)
         self.min_consensus_bars = min_consensus_bars if min_consensus_bars is not None else getattr(Config, 'STRATEGY_MIN_CONSENSUS_BARS', 2)
         self.last_action_time: Dict[str, float] = {}
-        self.consensus_streak: Dict[str, int] = {}
         self.is_strategy_learned = False  # 标识策略是否是学习后的
+        self._batch_now: float = 0.0  # 批次时间（time.monotonic），0 表示不在批次中
+
+    def begin_batch(self):
+        """开始一批评估：同一批（一次 gather）内的 evaluate 共用一次取得的时间"""
+        self._batch_now = time.monotonic()
+
+    def end_batch(self):
+        """结束批量评估，evaluate 恢复为每次调用时取时间"""
+        self._batch_now = 0.0
 
     def evaluate(self, platform_metrics: Dict[str, dict], consensus: str, signals: List[dict], symbol: str, df_5m: object = None, df_1h: object = None) -> Dict:
         """
         Evaluate market conditions to generate entry/exit signals.
         Supports multi-timeframe trend confirmation.
         """
-        total_flow = sum(m.get('cumulative_net_flow', 0.0) for m in platform_metrics.values())
-        ratios = [m.get('buy_sell_ratio', 0.0) for m in platform_metrics.values() if m.get('buy_sell_ratio') is not None]
-        prices = [m.get('current_price', 0.0) for m in platform_metrics.values() if m.get('current_price') is not None]
-        supports = [m.get('support_low', 0.0) for m in platform_metrics.values() if m.get('support_low') is not None]
-        resistances = [m.get('resistance_high', 0.0) for m in platform_metrics.values() if m.get('resistance_high') is not None]
-        atrs = [m.get('atr', 0.0) for m in platform_metrics.values() if m.get('atr') is not None]
-        
-        avg_ratio = sum(ratios) / len(ratios) if ratios else 0.0
-        current_price = float(np.median(prices)) if prices else 0.0
-        support = float(np.median(supports)) if supports else 0.0
-        resistance = float(np.median(resistances)) if resistances else 0.0
-        atr = float(np.median(atrs)) if atrs else 0.0
-        
-        # Trend Analysis (5m & 1h)
-        trend_5m = "NEUTRAL"
-        trend_1h = "NEUTRAL"
-        
-        # Optimized DataFrame access
-        from src.utils.dataframe_helpers import get_latest_value
-        
-        if df_5m is not None and not df_5m.empty:
-            close = get_latest_value(df_5m, 'close', 0.0)
-            sma20_series = df_5m['close'].rolling(20).mean()
-            # Get last value from Series directly (more efficient)
-            sma20 = sma20_series.iloc[-1] if len(sma20_series) > 0 and not pd.isna(sma20_series.iloc[-1]) else 0.0
-            if close > sma20: trend_5m = "BULLISH"
-            elif close < sma20: trend_5m = "BEARISH"
-            
-        if df_1h is not None and not df_1h.empty:
-            close = get_latest_value(df_1h, 'close', 0.0)
-            sma20_series = df_1h['close'].rolling(20).mean()
-            # Get last value from Series directly (more efficient)
-            sma20 = sma20_series.iloc[-1] if len(sma20_series) > 0 and not pd.isna(sma20_series.iloc[-1]) else 0.0
-            if close > sma20: trend_1h = "BULLISH"
-            elif close < sma20: trend_1h = "BEARISH"
-            
-        has_strong_signal = any(s.get('grade') in ('A+', 'A') for s in signals)
-        # consensus参数已废弃，不再使用
-        bullish_consensus = False
-        bearish_consensus = False
-        
-        now = time.time()
+        # 冷却检查放在最前：冷却中的品种无需聚合指标和计算趋势
+        # 批次内复用同一时间戳；单调时钟不受系统时间调整影响
+        now = self._batch_now or time.monotonic()
         last_ts = self.last_action_time.get(symbol, 0)
         if last_ts and now - last_ts < self.min_interval_sec:
             return {'action': None, 'symbol': symbol}
-            
-        # 不再使用consensus_streak，因为consensus参数已废弃
-        streak = 0
         
-        midband_ok = True
-        if self.require_midband and support > 0 and resistance > 0:
-            mid = (support + resistance) / 2.0
-            # 由于consensus已废弃，这里不再检查midband
+        total_flow, avg_ratio, current_price, support, resistance, atr = self._aggregate_metrics(platform_metrics)
         
+        # consensus参数已废弃，不再使用；midband 检查依赖 consensus，同样不再计算
         # ENTRY LOGIC
         action = None
         side = None
         reason = None
         
-        # Long Entry
-        if has_strong_signal or (total_flow >= self.min_total_flow and avg_ratio >= self.min_ratio):
-            # MTF Confirmation: Don't go long if 1h trend is bearish
-            mtf_ok = True
-            if trend_1h == "BEARISH": 
-                mtf_ok = False
+        # 趋势只在存在入场候选时才需要，其余品种只做突破离场检查
+        trend_5m = trend_1h = None
+        
+        # Long Entry：先做标量的资金流判断，不满足时才扫描强信号列表
+        if (total_flow >= self.min_total_flow and avg_ratio >= self.min_ratio) or \
+                any(s.get('grade') in _STRONG_GRADES for s in signals):
+            # Trend Analysis (5m & 1h)
+            trend_5m = self._trend(df_5m)
+            trend_1h = self._trend(df_1h)
             
-            if midband_ok and mtf_ok:
+            # MTF Confirmation: Don't go long if 1h trend is bearish
+            if trend_1h != "BEARISH":
                 action = 'ENTRY'
                 side = 'LONG'
                 reason = f'Strong Signal + Trend({trend_1h})'
@@ -109,61 +105,97 @@ class EntryExitStrategy:
         #         reason = f'Bearish Consensus + Trend({trend_1h})'
         
         if action:
+            # LONG 为 +1、SHORT 为 -1：止损在价格反方向，止盈在价格同方向
+            sign = 1 if side == 'LONG' else -1
             sl = None
             tp = None
             
             # Dynamic Risk Reward Optimization
             # Default RR = 2.0 / 1.5 = 1.33
             # If trend is aligned (e.g. 5m matches signal), boost TP
-            rr_boost = 1.0
-            if side == 'LONG' and trend_5m == "BULLISH": rr_boost = 1.2
-            if side == 'SHORT' and trend_5m == "BEARISH": rr_boost = 1.2
+            aligned_trend = "BULLISH" if sign > 0 else "BEARISH"
+            rr_boost = 1.2 if trend_5m == aligned_trend else 1.0
             
             final_sl_mult = self.atr_sl_mult
             final_tp_mult = self.atr_tp_mult * rr_boost
             
             if atr > 0:
-                if side == 'LONG':
-                    sl = current_price - final_sl_mult * atr
-                    tp = current_price + final_tp_mult * atr
-                else:
-                    sl = current_price + final_sl_mult * atr
-                    tp = current_price - final_tp_mult * atr
-            
-            # Fallback to Support/Resistance
-            if sl is None:
-                if side == 'LONG' and support > 0: sl = support * 0.99
-                elif side == 'SHORT' and resistance > 0: sl = resistance * 1.01
-                
-            if tp is None:
-                if side == 'LONG' and resistance > 0: tp = resistance
-                elif side == 'SHORT' and support > 0: tp = support
+                sl = current_price - sign * final_sl_mult * atr
+                tp = current_price + sign * final_tp_mult * atr
+            else:
+                # Fallback to Support/Resistance
+                anchor_sl, anchor_tp = (support, resistance) if sign > 0 else (resistance, support)
+                if anchor_sl > 0: sl = anchor_sl * (1 - 0.01 * sign)
+                if anchor_tp > 0: tp = anchor_tp
             
             # Final sanity check for SL/TP
-            if sl and tp:
-                self.last_action_time[symbol] = now
-                return {
-                    'action': action, 
-                    'side': side, 
-                    'price': current_price, 
-                    'stop_loss': sl, 
-                    'take_profit': tp, 
-                    'reason': reason, 
-                    'symbol': symbol,
-                    'trend_1h': trend_1h,
-                    'trend_5m': trend_5m
-                }
+            if not (sl and tp):
+                action = None
 
         # EXIT LOGIC
-        if support > 0 and current_price < support:
-            self.last_action_time[symbol] = now
-            return {'action': 'EXIT', 'side': 'LONG', 'price': current_price, 'reason': 'break_support', 'symbol': symbol}
-        if resistance > 0 and current_price > resistance:
-            self.last_action_time[symbol] = now
-            return {'action': 'EXIT', 'side': 'SHORT', 'price': current_price, 'reason': 'break_resistance', 'symbol': symbol}
-            
-        return {'action': None, 'symbol': symbol}
+        if not action:
+            sl = tp = None
+            if support > 0 and current_price < support:
+                action, side, reason = 'EXIT', 'LONG', 'break_support'
+            elif resistance > 0 and current_price > resistance:
+                action, side, reason = 'EXIT', 'SHORT', 'break_resistance'
+            else:
+                return {'action': None, 'symbol': symbol}
+
+        # 所有分支共用同一个结果构造点；调用方会 update 并持久化该字典，故每次新建
+        self.last_action_time[symbol] = now
+        return {
+            'action': action, 
+            'side': side, 
+            'price': current_price, 
+            'stop_loss': sl, 
+            'take_profit': tp, 
+            'reason': reason, 
+            'symbol': symbol,
+            'trend_1h': trend_1h,
+            'trend_5m': trend_5m
+        }
+    
     
+    @staticmethod
+    def _trend(df) -> str:
+        """收盘价相对 SMA20 的方向：BULLISH / BEARISH / NEUTRAL"""
+        if df is None or df.empty:
+            return "NEUTRAL"
+        # 只需最新的 SMA20：对末尾20根取均值，不计算整条滚动序列
+        closes = df['close'].to_numpy()
+        close = closes[-1]
+        sma20 = float(closes[-20:].mean()) if len(closes) >= 20 else 0.0
+        if np.isnan(sma20): sma20 = 0.0
+        if close > sma20: return "BULLISH"
+        if close < sma20: return "BEARISH"
+        return "NEUTRAL"
+    
+    def _aggregate_metrics(self, platform_metrics: Dict[str, dict]):
+        """
+        一次遍历各平台指标按字段收集有效值（跳过缺失/None/NaN），再做求和、均值和中位数。
+        平台数通常只有 1~4 个，纯 Python 归约比构造 ndarray 再调用 numpy 更快。
+        返回 (total_flow, avg_ratio, price, support, resistance, atr)，无有效值时为 0.0。
+        """
+        flows: List[float] = []
+        ratios: List[float] = []
+        prices: List[float] = []
+        supports: List[float] = []
+        resistances: List[float] = []
+        atrs: List[float] = []
+        for m in platform_metrics.values():
+            for vals, key in ((flows, 'cumulative_net_flow'), (ratios, 'buy_sell_ratio'),
+                              (prices, 'current_price'), (supports, 'support_low'),
+                              (resistances, 'resistance_high'), (atrs, 'atr')):
+                v = m.get(key)
+                # v == v 排除 NaN
+                if v is not None and v == v:
+                    vals.append(float(v))
+        
+        total_flow = sum(flows) if flows else 0.0
+        avg_ratio = sum(ratios) / len(ratios) if ratios else 0.0
+        return (total_flow, avg_ratio, _median_small(prices), _median_small(supports),
+                _median_small(resistances), _median_small(atrs))
     
     def compute_position(self, rec: Dict, volatility_level: str = 'NORMAL') -> Dict:
         """
@@ -178,10 +210,7 @@ class EntryExitStrategy:
             return {}
             
         # 使用 PositionManager 替代旧的硬编码逻辑
-        from src.utils.position_manager import PositionManager
-        pm = PositionManager() # 会自动读取 Config 配置
-        
-        pos_info = pm.calculate_position_size(
+        pos_info = _get_position_manager().calculate_position_size(
             symbol=symbol,
             entry_price=price,
             stop_loss=sl,
@@ -190,7 +219,6 @@ class EntryExitStrategy:
         )
         
         if not pos_info.get('allowed', False):
-            from src.utils.logger import logger
             logger.warning(f"[{symbol}] 仓位限制: {pos_info.get('reason')}")
             return {}
             
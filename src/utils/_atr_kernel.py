@@ -0,0 +1,38 @@
+"""
+ATR 计算内核（纯 Python 源码，不带装饰器）
+由 indicators.py 以 numba.njit 编译，或由 _build_aot.py 预编译为扩展模块。
+"""
+
+import numpy as np
+
+
+def atr_ewm(high, low, close, period):
+    """TR 与 EMA(adjust=False) 递推融合为单次循环，返回最后一个 ATR 值
+
+    与 pandas ewm(span=period, adjust=False, ignore_na=False) 逐步一致：
+    任一输入为 NaN 时 TR 为 NaN，旧值权重在 NaN 期间继续按 (1-alpha) 衰减。
+    """
+    com = (period - 1) / 2.0
+    alpha = 1.0 / (1.0 + com)
+    old_wt_factor = 1.0 - alpha
+    old_wt = 1.0
+    a = np.nan
+    for i in range(len(high)):
+        prev = close[i - 1] if i > 0 else close[0]
+        hl = high[i] - low[i]
+        hp = abs(high[i] - prev)
+        lp = abs(low[i] - prev)
+        # 与 np.maximum 相同的 NaN 传播（内置 max 遇 NaN 结果依赖参数顺序）
+        if hl != hl or hp != hp or lp != lp:
+            tr = np.nan
+        else:
+            tr = max(hl, hp, lp)
+        if a == a:
+            old_wt *= old_wt_factor
+            if tr == tr:
+                if a != tr:
+                    a = (old_wt * a + alpha * tr) / (old_wt + alpha)
+                old_wt = 1.0
+        elif tr == tr:
+            a = tr
+    return a
@@ -0,0 +1,21 @@
+"""
+预编译（AOT）指标内核，消除 numba 首次调用时的 JIT 编译延迟
+
+用法（需安装 numba，生成的扩展模块运行时只依赖 numpy）:
+    PYTHONPATH=. python -m src.utils._build_aot
+生成 src/utils/indicators_aot.*.so，indicators.py 导入时优先加载。
+"""
+
+import os
+
+from numba.pycc import CC
+
+from src.utils._atr_kernel import atr_ewm
+
+cc = CC('indicators_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export('atr_ewm', 'f8(f8[:], f8[:], f8[:], i8)')(atr_ewm)
+
+
+if __name__ == '__main__':
+    cc.compile()
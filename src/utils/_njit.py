@@ -0,0 +1,22 @@
+"""
+可选依赖 numba 的 JIT 装饰器
+未安装 numba 时 njit 为空装饰器，被装饰函数以纯 Python 运行；
+调用方可根据 NUMBA_AVAILABLE 选择是否走 JIT 内核。
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def _identity_njit(*args, **kwargs):
+        """numba.njit 的空实现，支持 @njit 与 @njit(cache=True) 两种写法"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+    njit = _identity_njit
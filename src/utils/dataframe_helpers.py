@@ -3,6 +3,7 @@ DataFrame 辅助函数
 提供优化的 DataFrame 访问方法，减少重复的 .iloc[-1] 调用
 """
 
+import numpy as np
 import pandas as pd
 from typing import Tuple, Optional, List, Any
 
@@ -33,6 +34,30 @@ def get_latest_values(df: pd.DataFrame, n: int = 2) -> Tuple[pd.Series, ...]:
     return tuple(tail_data.iloc[-(i+1)] for i in range(len(tail_data)))
 
 
+def get_latest_array(df: pd.DataFrame, cols: List[str], n: int = 2) -> Optional[np.ndarray]:
+    """
+    获取最后 n 行指定列的数值数组，不构造任何行 Series
+    
+    Args:
+        df: 输入的 DataFrame
+        cols: 列名列表
+        n: 需要获取的行数，默认2行
+        
+    Returns:
+        形状为 (n, len(cols)) 的数组，第0行为最后一行（最新），依次向前；
+        如果数据不足返回 None
+        
+    Example:
+        >>> arr = get_latest_array(df, ['close', 'volume'], n=2)
+        >>> cur_close, prev_close = arr[0, 0], arr[1, 0]
+    """
+    if df is None or len(df) < n:
+        return None
+    
+    # 逐列取末尾 n 个值（列数组视图上的切片），只复制 n*len(cols) 个元素
+    return np.column_stack([df[c].to_numpy()[-n:] for c in cols])[::-1]
+
+
 def get_latest_value(df: pd.DataFrame, column: str, default: Any = None) -> Any:
     """
     获取 DataFrame 最后一行的指定列值
@@ -1,36 +1,30 @@
 
 import asyncio
 import ccxt.async_support as ccxt
-from typing import Set, List, Dict
+from typing import Set, List, Dict, Optional
 from src.utils.logger import logger
 
 class SymbolDiscovery:
-    def __init__(self):
-        self.exchanges = {
-            'binance': ccxt.binance(),
-            'okx': ccxt.okx(),
-            'bybit': ccxt.bybit(),
-            'coinbase': ccxt.coinbase()
-        }
+    EXCHANGE_IDS = ('binance', 'okx', 'bybit', 'coinbase')
 
-    async def fetch_symbols(self, exchange_id: str, exchange) -> Set[str]:
+    def __init__(self, exchanges: Optional[Dict[str, ccxt.Exchange]] = None):
+        """
+        Args:
+            exchanges: 调用方已持有的 ccxt 客户端 {exchange_id: client}，复用且不负责关闭；
+                       缺失的交易所在 get_common_symbols 中按需创建并在使用后关闭
+        """
+        self.exchanges = exchanges or {}
+
+    async def fetch_symbols(self, exchange_id: str, exchange, owned: bool = True) -> Set[str]:
         try:
             await exchange.load_markets()
-            symbols = set()
-            for s in exchange.symbols:
-                # Filter for USDT pairs (linear futures or spot depending on preference, 
-                # but let's stick to standard format like BTC/USDT)
-                # Note: Coinbase uses USD mostly, not USDT for many pairs, but has USDT books.
-                # However, our connectors mapped things. 
-                # Let's standardize: Base/USDT.
-                if '/USDT' in s:
-                    symbols.add(s)
-                elif exchange_id == 'coinbase' and '/USD' in s:
-                     # Coinbase often has USD pairs. We might map them if we want broader coverage
-                     # But our current system heavily implies USDT standardization.
-                     # Let's check if Coinbase has USDT pairs.
-                     if '/USDT' in s:
-                         symbols.add(s)
+            # Filter for USDT pairs: 现货 BASE/USDT 与线性合约 BASE/USDT:USDT
+            # (Coinbase 的 USD 交易对不计入，统一使用 USDT 标准化)
+            # 直接比较已加载市场的 quote 字段，并剔除明确下架（active=False）的市场
+            symbols = {
+                s for s, m in exchange.markets.items()
+                if m.get('quote') == 'USDT' and m.get('active') is not False
+            }
             
             logger.info(f"[{exchange_id}] Found {len(symbols)} USDT pairs")
             return symbols
@@ -38,20 +32,23 @@ class SymbolDiscovery:
             logger.error(f"[{exchange_id}] Failed to fetch symbols: {e}")
             return set()
         finally:
-            await exchange.close()
+            if owned:
+                await exchange.close()
 
     async def get_common_symbols(self) -> List[str]:
         tasks = []
-        for name, ex in self.exchanges.items():
-            tasks.append(self.fetch_symbols(name, ex))
+        for name in self.EXCHANGE_IDS:
+            ex = self.exchanges.get(name)
+            if ex is not None:
+                tasks.append(self.fetch_symbols(name, ex, owned=False))
+            else:
+                tasks.append(self.fetch_symbols(name, getattr(ccxt, name)()))
         
         results = await asyncio.gather(*tasks)
         
-        # Intersection
-        common = set(results[0])
-        for res in results[1:]:
-            if res:
-               common &= res
+        # Intersection（跳过获取失败的交易所；从最小的集合开始求交集）
+        results = sorted((r for r in results if r), key=len)
+        common = set.intersection(*results) if results else set()
                
         # Sort? Maybe by alphabetical for now. 
         # Ideally by volume but that requires fetching tickers.
@@ -7,6 +7,15 @@ import pandas as pd
 import numpy as np
 from typing import Optional, Tuple
 
+from src.utils._atr_kernel import atr_ewm as _atr_ewm_py
+
+# ATR 内核：优先加载预编译模块（见 _build_aot.py），其次 numba JIT，都不可用时为 None
+try:
+    from src.utils.indicators_aot import atr_ewm as _atr_ewm
+except ImportError:
+    from src.utils._njit import njit, NUMBA_AVAILABLE
+    _atr_ewm = njit(cache=True)(_atr_ewm_py) if NUMBA_AVAILABLE else None
+
 
 def calculate_atr(df: pd.DataFrame, period: int = 14) -> Optional[float]:
     """
@@ -23,29 +32,17 @@ def calculate_atr(df: pd.DataFrame, period: int = 14) -> Optional[float]:
         return None
     
     try:
-        # 计算True Range
-        # TR = max(high-low, abs(high-prev_close), abs(low-prev_close))
-        high = df['high'].values
-        low = df['low'].values
-        close = df['close'].values
-        
-        # 前一日收盘价
-        prev_close = np.roll(close, 1)
-        prev_close[0] = close[0]  # 第一个值使用自身
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
         
-        # 三种范围
-        tr1 = high - low
-        tr2 = np.abs(high - prev_close)
-        tr3 = np.abs(low - prev_close)
+        # 有编译内核时直接调用，避免中间数组与 pandas Series 构造
+        if _atr_ewm is not None:
+            return float(_atr_ewm(high, low, close, int(period)))
         
-        # True Range = 三者最大值
-        tr = np.maximum(tr1, np.maximum(tr2, tr3))
-        
-        # ATR = TR的移动平均
-        # 使用EMA（指数移动平均）
-        atr_series = pd.Series(tr).ewm(span=period, adjust=False).mean()
-        
-        return float(atr_series.iloc[-1])
+        # 无编译内核时以纯 Python 运行同一份内核源码，NaN 衰减逻辑只维护一处；
+        # 先转为 list，循环中按 Python float 运算，避免逐个取 numpy 标量
+        return float(_atr_ewm_py(high.tolist(), low.tolist(), close.tolist(), int(period)))
         
     except Exception as e:
         return None
@@ -94,8 +91,8 @@ def calculate_ma(df: pd.DataFrame, period: int = 20, column: str = 'close') -> O
         return None
     
     try:
-        ma = df[column].rolling(window=period).mean().iloc[-1]
-        return float(ma)
+        # 只需最后一个值：直接对末尾 period 个数取均值，不计算整条滚动序列
+        return float(df[column].to_numpy()[-period:].mean())
     except Exception:
         return None
 
@@ -111,12 +108,15 @@ def calculate_ema(df: pd.DataFrame, period: int = 20, column: str = 'close') ->
         
     Returns:
         当前EMA值，如果数据不足返回None
+        
+    Note:
+        只使用末尾 4*period 根K线递推，更早数据的权重不超过 (1-alpha)^(4*period)（约 e^-8），可忽略。
     """
     if df is None or len(df) < period or column not in df.columns:
         return None
     
     try:
-        ema = df[column].ewm(span=period, adjust=False).mean().iloc[-1]
+        ema = df[column].iloc[-4 * period:].ewm(span=period, adjust=False).mean().iloc[-1]
         return float(ema)
     except Exception:
         return None
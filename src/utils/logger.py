@@ -17,12 +17,14 @@ def setup_logger():
     )
     
     # Add file handler for structured logging (JSON or regular text)
+    # enqueue: 文件写入（含轮转/压缩）交给后台线程，告警突发时不阻塞事件循环
     logger.add(
         "logs/app.log",
         rotation="1 day",
         retention="7 days",
         level=Config.LOG_LEVEL,
-        compression="zip"
+        compression="zip",
+        enqueue=True
     )
 
 # Initialize logger on module import
@@ -6,10 +6,27 @@
 
 import pandas as pd
 import time
-from typing import Optional, Dict
-from src.utils.indicators import calculate_ma
+from collections import deque
+from types import MappingProxyType
+from typing import Optional, Mapping, Tuple
 from src.utils.logger import logger
 
+
+def _regime_result(regime: str, desc: str) -> Mapping[str, str]:
+    """只读的判定结果，各次 analyze 共享同一对象"""
+    return MappingProxyType({'regime': regime, 'desc': desc})
+
+
+# 固定的判定结果：命中时直接返回引用，不再每次构造字典
+_RESULT_BULL = _regime_result('BULL', "多头趋势 (Price > MA20 > MA60)")
+_RESULT_BEAR = _regime_result('BEAR', "空头趋势 (Price < MA20 < MA60)")
+_RESULT_NEUTRAL_BULL = _regime_result('NEUTRAL_BULL', "偏多震荡 (Price > MA60)")
+_RESULT_NEUTRAL_BEAR = _regime_result('NEUTRAL_BEAR', "偏空震荡 (Price < MA60)")
+_RESULT_NEUTRAL = _regime_result('NEUTRAL', "震荡整理")
+_RESULT_NO_DATA = _regime_result('NEUTRAL', '数据不足，默认为震荡')
+_RESULT_MA_FAILED = _regime_result('NEUTRAL', '指标计算失败')
+_RESULT_ERROR = _regime_result('NEUTRAL', '分析错误，默认为震荡')
+
 class MarketRegimeDetector:
     """
     市场环境检测器
@@ -35,8 +52,17 @@ class MarketRegimeDetector:
             cache_ttl: 缓存有效期（秒），默认300秒（5分钟）
         """
         self.cache_ttl = cache_ttl
-        self._cache: Optional[Dict[str, any]] = None
-        self._cache_timestamp: float = 0.0
+        self._cache: Optional[Mapping[str, str]] = None
+        # 缓存过期时刻（time.monotonic），命中检查只需一次比较
+        self._cache_expiry: float = 0.0
+        # 最近一次计算所用K线的标识 (最后一根K线时间, 收盘价)，K线未变化时直接复用结果
+        self._bar_key: Optional[tuple] = None
+        # MA20/MA60 增量计算状态：窗口内收盘价与窗口和，_last_ts 为已计入的最后一根K线
+        self._last_ts: Optional[pd.Timestamp] = None
+        self._win20: deque = deque(maxlen=20)
+        self._win60: deque = deque(maxlen=60)
+        self._sum20: float = 0.0
+        self._sum60: float = 0.0
     
     def is_cache_valid(self) -> bool:
         """
@@ -45,12 +71,9 @@ class MarketRegimeDetector:
         Returns:
             True 如果缓存有效，False 如果缓存过期或不存在
         """
-        if self._cache is None:
-            return False
-        current_time = time.time()
-        return (current_time - self._cache_timestamp) < self.cache_ttl
+        return self._cache is not None and time.monotonic() < self._cache_expiry
     
-    def get_cached_result(self) -> Optional[Dict[str, str]]:
+    def get_cached_result(self) -> Optional[Mapping[str, str]]:
         """
         获取缓存的结果（如果有效）
         
@@ -61,7 +84,7 @@ class MarketRegimeDetector:
             return self._cache
         return None
     
-    def analyze(self, btc_df: pd.DataFrame, force_refresh: bool = False) -> Dict[str, str]:
+    def analyze(self, btc_df: pd.DataFrame, force_refresh: bool = False) -> Mapping[str, str]:
         """
         分析市场环境
         
@@ -76,63 +99,94 @@ class MarketRegimeDetector:
             }
         """
         # 检查缓存
-        current_time = time.time()
-        if not force_refresh and self._cache is not None:
-            if current_time - self._cache_timestamp < self.cache_ttl:
-                logger.debug(f"使用缓存的市场环境数据 (缓存剩余 {int(self.cache_ttl - (current_time - self._cache_timestamp))}秒)")
-                return self._cache
+        current_time = time.monotonic()
+        if not force_refresh and self._cache is not None and current_time < self._cache_expiry:
+            # lazy: 仅当 DEBUG 日志实际输出时才计算剩余时间并格式化
+            logger.opt(lazy=True).debug("使用缓存的市场环境数据 (缓存剩余 {}秒)",
+                                        lambda: int(self._cache_expiry - current_time))
+            return self._cache
         
         if btc_df is None or btc_df.empty or len(btc_df) < 65:
-            result = {'regime': 'NEUTRAL', 'desc': '数据不足，默认为震荡'}
-            self._update_cache(result)
-            return result
+            self._update_cache(_RESULT_NO_DATA)
+            return _RESULT_NO_DATA
+        
+        # TTL 过期但 K线数据未变化（同一根K线、同一收盘价）时无需重新计算
+        bar_key = (btc_df.index[-1], btc_df['close'].iat[-1])
+        if not force_refresh and self._cache is not None and bar_key == self._bar_key:
+            self._update_cache(self._cache)
+            return self._cache
             
         try:
-            # Optimized DataFrame access
-            from src.utils.dataframe_helpers import get_latest_value
-            current_price = get_latest_value(btc_df, 'close', 0.0)
-            ma20 = calculate_ma(btc_df, 20)
-            ma60 = calculate_ma(btc_df, 60)
+            current_price = bar_key[1]
+            ma20, ma60 = self._update_ma(btc_df)
             
             if not ma20 or not ma60:
-                return {'regime': 'NEUTRAL', 'desc': '指标计算失败'}
-            
-            # 判定逻辑
-            regime = 'NEUTRAL'
-            desc = "震荡整理"
+                return _RESULT_MA_FAILED
             
             # 牛市判定: 价格 > MA20 > MA60
             if current_price > ma20 and ma20 > ma60:
-                regime = 'BULL'
-                desc = "多头趋势 (Price > MA20 > MA60)"
-                
+                result = _RESULT_BULL
             # 熊市判定: 价格 < MA20 < MA60
             elif current_price < ma20 and ma20 < ma60:
-                regime = 'BEAR'
-                desc = "空头趋势 (Price < MA20 < MA60)"
-            
+                result = _RESULT_BEAR
             # 辅助判定: 价格与 MA60 关系
             elif current_price > ma60:
-                regime = 'NEUTRAL_BULL' # 偏多震荡
-                desc = "偏多震荡 (Price > MA60)"
+                result = _RESULT_NEUTRAL_BULL  # 偏多震荡
             elif current_price < ma60:
-                regime = 'NEUTRAL_BEAR' # 偏空震荡
-                desc = "偏空震荡 (Price < MA60)"
-                
-            result = {
-                'regime': regime,
-                'desc': desc
-            }
+                result = _RESULT_NEUTRAL_BEAR  # 偏空震荡
+            else:
+                result = _RESULT_NEUTRAL
+            
             self._update_cache(result)
+            self._bar_key = bar_key
             return result
             
         except Exception as e:
+            # 异常详情只写日志，返回共享的只读结果，与其他分支类型一致且不会经缓存被改写
             logger.error(f"市场环境分析失败: {e}")
-            result = {'regime': 'NEUTRAL', 'desc': f'分析错误: {e}'}
-            self._update_cache(result)
-            return result
+            self._update_cache(_RESULT_ERROR)
+            return _RESULT_ERROR
+    
+    def _update_ma(self, btc_df: pd.DataFrame) -> Tuple[float, float]:
+        """
+        增量更新 MA20/MA60：只把上次之后新增的K线计入滑动窗口和，
+        上次的最后一根K线（可能尚未收盘）用最新收盘价替换。
+        首次调用或K线不连续时用末尾窗口重新初始化。
+        """
+        closes = btc_df['close'].to_numpy()
+        index = btc_df.index
+        
+        start = None
+        if self._last_ts is not None:
+            pos = index.searchsorted(self._last_ts)
+            if pos < len(index) and index[pos] == self._last_ts:
+                start = pos
+        
+        if start is None:
+            self._win20 = deque(closes[-20:].tolist(), maxlen=20)
+            self._win60 = deque(closes[-60:].tolist(), maxlen=60)
+            self._sum20 = sum(self._win20)
+            self._sum60 = sum(self._win60)
+        else:
+            win20, win60 = self._win20, self._win60
+            new = float(closes[start])
+            self._sum20 += new - win20[-1]
+            self._sum60 += new - win60[-1]
+            win20[-1] = win60[-1] = new
+            # 窗口已满，append 会自动挤出最旧的收盘价
+            for c in closes[start + 1:].tolist():
+                self._sum20 += c - win20[0]
+                win20.append(c)
+                self._sum60 += c - win60[0]
+                win60.append(c)
+        
+        ma20 = self._sum20 / 20
+        ma60 = self._sum60 / 60
+        # 出现 NaN 时窗口和已失效，下次重新初始化
+        self._last_ts = index[-1] if ma20 == ma20 and ma60 == ma60 else None
+        return ma20, ma60
     
-    def _update_cache(self, result: Dict[str, str]):
+    def _update_cache(self, result: Mapping[str, str]):
         """
         更新缓存
         
@@ -140,9 +194,11 @@ class MarketRegimeDetector:
             result: 分析结果
         """
         self._cache = result
-        self._cache_timestamp = time.time()
+        self._cache_expiry = time.monotonic() + self.cache_ttl
     
     def clear_cache(self):
         """清除缓存"""
         self._cache = None
-        self._cache_timestamp = 0.0
+        self._cache_expiry = 0.0
+        self._bar_key = None
+        self._last_ts = None
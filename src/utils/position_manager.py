@@ -5,8 +5,16 @@
 
 from typing import Dict, Optional
 from src.config import Config
+from src.models import Position
 from src.utils.logger import logger
 
+# 波动率等级 -> 仓位倍数（模块级常量，不在每次计算时重建）
+_VOLATILITY_MULTIPLIERS = {
+    'LOW': 1.2,    # 低波动，增加20%仓位
+    'NORMAL': 1.0, # 正常波动，标准仓位
+    'HIGH': 0.5    # 高波动，减半仓位
+}
+
 
 class PositionManager:
     """
@@ -27,7 +35,10 @@ class PositionManager:
             account_balance: 账户余额，默认使用配置中的值
         """
         self.account_balance = account_balance or Config.ACCOUNT_BALANCE
-        self.positions: Dict[str, dict] = {}  # 当前持仓 {symbol: position_info}
+        self.positions: Dict[str, Position] = {}  # 当前持仓 {symbol: Position}
+        # 总敞口/总风险随 add_position/remove_position 增量维护
+        self._total_notional = 0.0
+        self._total_risk = 0.0
         self.max_positions = Config.MAX_POSITIONS
         self.risk_per_trade = Config.RISK_PERCENTAGE / 100
         self.max_notional = Config.MAX_POSITION_NOTIONAL
@@ -88,7 +99,7 @@ class PositionManager:
         if notional_value > self.max_notional:
             adjusted_size = self.max_notional / entry_price
             notional_value = self.max_notional
-            logger.debug(f"[{symbol}] 仓位因名义价值限制被调整: {notional_value:.2f} USDT")
+            logger.debug("[{}] 仓位因名义价值限制被调整: {:.2f} USDT", symbol, notional_value)
         
         # 7. 计算实际风险和回报
         actual_risk = adjusted_size * risk_per_coin
@@ -131,12 +142,7 @@ class PositionManager:
         Returns:
             仓位倍数
         """
-        multipliers = {
-            'LOW': 1.2,    # 低波动，增加20%仓位
-            'NORMAL': 1.0, # 正常波动，标准仓位
-            'HIGH': 0.5    # 高波动，减半仓位
-        }
-        return multipliers.get(volatility_level, 1.0)
+        return _VOLATILITY_MULTIPLIERS.get(volatility_level, 1.0)
     
     def _check_can_open(self, symbol: str) -> tuple:
         """
@@ -155,17 +161,21 @@ class PositionManager:
         
         return True, "OK"
     
-    def add_position(self, symbol: str, position_info: dict):
+    def add_position(self, symbol: str, position: Position):
         """
         添加持仓记录
         
         Args:
             symbol: 交易对符号
-            position_info: 仓位信息
-        """
-        self.positions[symbol] = position_info
-        logger.info(f"📈 新增持仓: {symbol}, 数量={position_info.get('size')}, "
-                   f"名义价值={position_info.get('notional')} USDT")
+            position: 仓位信息
+        """
+        # 覆盖已有持仓时先扣除旧仓位
+        self._discount(self.positions.get(symbol))
+        self.positions[symbol] = position
+        self._total_notional += position.notional
+        self._total_risk += position.risk_amount
+        logger.info(f"📈 新增持仓: {symbol}, 数量={position.size}, "
+                   f"名义价值={position.notional} USDT")
     
     def remove_position(self, symbol: str):
         """
@@ -176,9 +186,21 @@ class PositionManager:
         """
         if symbol in self.positions:
             pos = self.positions.pop(symbol)
-            logger.info(f"📉 平仓: {symbol}, 名义价值={pos.get('notional')} USDT")
+            self._discount(pos)
+            logger.info(f"📉 平仓: {symbol}, 名义价值={pos.notional} USDT")
+    
+    def _discount(self, pos: Optional[Position]):
+        """从总敞口/总风险中扣除一个仓位"""
+        if pos is None:
+            return
+        self._total_notional -= pos.notional
+        self._total_risk -= pos.risk_amount
+        if not self.positions:
+            # 清仓后归零，避免浮点累积误差
+            self._total_notional = 0.0
+            self._total_risk = 0.0
     
-    def get_position(self, symbol: str) -> Optional[dict]:
+    def get_position(self, symbol: str) -> Optional[Position]:
         """
         获取指定持仓信息
         
@@ -186,7 +208,7 @@ class PositionManager:
             symbol: 交易对符号
             
         Returns:
-            仓位信息字典或None
+            仓位信息或None
         """
         return self.positions.get(symbol)
     
@@ -197,7 +219,7 @@ class PositionManager:
         Returns:
             总敞口（USDT）
         """
-        return sum(pos.get('notional', 0) for pos in self.positions.values())
+        return self._total_notional
     
     def get_total_risk(self) -> float:
         """
@@ -206,7 +228,7 @@ class PositionManager:
         Returns:
             总风险（USDT）
         """
-        return sum(pos.get('risk_amount', 0) for pos in self.positions.values())
+        return self._total_risk
     
     def get_position_count(self) -> int:
         """
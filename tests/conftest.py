@@ -3,6 +3,7 @@ Pytest configuration and fixtures
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
 from src.core.context import AnalysisContext
@@ -17,17 +18,21 @@ from src.strategies.entry_exit import EntryExitStrategy
 @pytest.fixture
 def sample_candle_data():
     """Sample candle data for testing"""
-    return pd.DataFrame({
-        'timestamp': pd.date_range('2024-01-01', periods=100, freq='1min'),
-        'open': [100.0] * 100,
-        'high': [101.0] * 100,
-        'low': [99.0] * 100,
-        'close': [100.5] * 100,
-        'volume': [1000.0] * 100,
-        'taker_buy_usdt': [600.0] * 100,
-        'taker_sell_usdt': [400.0] * 100,
-        'net_flow_usdt': [200.0] * 100
-    }).set_index('timestamp')
+    n = 100
+    columns = {
+        'open': 100.0,
+        'high': 101.0,
+        'low': 99.0,
+        'close': 100.5,
+        'volume': 1000.0,
+        'taker_buy_usdt': 600.0,
+        'taker_sell_usdt': 400.0,
+        'net_flow_usdt': 200.0
+    }
+    return pd.DataFrame(
+        {name: np.full(n, value, dtype=np.float64) for name, value in columns.items()},
+        index=pd.date_range('2024-01-01', periods=n, freq='1min', name='timestamp')
+    )
 
 
 @pytest.fixture
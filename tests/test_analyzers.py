@@ -8,7 +8,11 @@ import numpy as np
 from src.analyzers.taker_flow import TakerFlowAnalyzer
 from src.analyzers.multi_platform import MultiPlatformAnalyzer
 from src.analyzers.accumulation import AccumulationAnalyzer
+from src.utils import indicators
+from src.utils._atr_kernel import atr_ewm
+from src.utils._njit import NUMBA_AVAILABLE, njit
 from src.utils.indicators import (
+    calculate_atr,
     calculate_obv,
     is_obv_rising,
     calculate_cmf,
@@ -109,6 +113,36 @@ class TestIndicators:
         assert bp is not None
         assert bp > 0.5
 
+    @pytest.mark.parametrize('kernel', ['python', 'njit', 'fallback'])
+    @pytest.mark.parametrize('nan_col,nan_row', [('high', 490), ('close', 495), ('low', 0)])
+    def test_calculate_atr_nan_matches_pandas_ewm(self, monkeypatch, kernel, nan_col, nan_row):
+        if kernel == 'njit':
+            if not NUMBA_AVAILABLE:
+                pytest.skip('numba not installed')
+            monkeypatch.setattr(indicators, '_atr_ewm', njit(cache=True)(atr_ewm))
+        elif kernel == 'fallback':
+            monkeypatch.setattr(indicators, '_atr_ewm', None)
+        else:
+            monkeypatch.setattr(indicators, '_atr_ewm', atr_ewm)
+
+        rng = np.random.default_rng(1)
+        close = 100 + rng.normal(0, 1, 500).cumsum()
+        df = pd.DataFrame({
+            'high': close + rng.uniform(0, 2, 500),
+            'low': close - rng.uniform(0, 2, 500),
+            'close': close,
+        })
+        df.loc[nan_row, nan_col] = np.nan
+
+        # 原实现：np.maximum 传播 NaN，ewm 默认 ignore_na=False
+        high, low, close = df['high'].values, df['low'].values, df['close'].values
+        prev_close = np.roll(close, 1)
+        prev_close[0] = close[0]
+        tr = np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+        expected = pd.Series(tr).ewm(span=14, adjust=False).mean().iloc[-1]
+
+        assert calculate_atr(df, 14) == pytest.approx(expected, rel=1e-12)
+
 
 class TestAccumulationAnalyzer:
 
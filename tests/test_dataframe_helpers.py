@@ -6,6 +6,7 @@ import pytest
 import pandas as pd
 from src.utils.dataframe_helpers import (
     get_latest_values,
+    get_latest_array,
     get_latest_value,
     get_latest_n_values
 )
@@ -58,3 +59,21 @@ class TestDataFrameHelpers:
         values = get_latest_n_values(df, 'close', n=3)
         assert len(values) == 3
         assert values == [102, 103, 104]
+    
+    def test_get_latest_array(self):
+        """Test get_latest_array function"""
+        df = pd.DataFrame({
+            'close': [100, 101, 102, 103, 104],
+            'volume': [1.0, 2.0, 3.0, 4.0, 5.0]
+        })
+        arr = get_latest_array(df, ['close', 'volume'], n=2)
+        assert arr.shape == (2, 2)
+        # Latest row first
+        assert list(arr[0]) == [104, 5.0]
+        assert list(arr[1]) == [103, 4.0]
+    
+    def test_get_latest_array_insufficient(self):
+        """Test get_latest_array with insufficient data"""
+        df = pd.DataFrame({'close': [100]})
+        assert get_latest_array(df, ['close'], n=2) is None
+        assert get_latest_array(pd.DataFrame(), ['close'], n=2) is None
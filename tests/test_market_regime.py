@@ -0,0 +1,62 @@
+"""
+Tests for MarketRegimeDetector
+"""
+
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+from src.utils.indicators import calculate_ma
+from src.utils.market_regime import MarketRegimeDetector
+
+
+def _btc_df(closes, start=0):
+    index = pd.date_range('2024-01-01', periods=len(closes), freq='h') + pd.Timedelta(hours=start)
+    return pd.DataFrame({'close': closes}, index=index)
+
+
+class TestMarketRegimeDetector:
+    """Tests for the incremental MA state"""
+
+    def test_incremental_ma_matches_full_window(self):
+        rng = np.random.default_rng(0)
+        closes = list(100 + rng.normal(0, 1, 300).cumsum())
+        detector = MarketRegimeDetector()
+
+        # 固定 100 根窗口向前滚动，每次新增 1~3 根，并模拟最后一根未收盘K线的价格变化
+        for end in range(100, 300, 2):
+            window = closes[end - 100:end]
+            window[-1] += 0.5
+            df = _btc_df(window, start=end - 100)
+            ma20, ma60 = detector._update_ma(df)
+            assert np.isclose(ma20, calculate_ma(df, 20))
+            assert np.isclose(ma60, calculate_ma(df, 60))
+
+    def test_gap_reseeds_window(self):
+        detector = MarketRegimeDetector()
+        detector._update_ma(_btc_df([1.0] * 100))
+        df = _btc_df([2.0] * 100, start=500)
+        assert detector._update_ma(df) == (2.0, 2.0)
+
+    def test_cache_expiry(self):
+        detector = MarketRegimeDetector(cache_ttl=300)
+        assert detector.get_cached_result() is None
+        result = detector.analyze(_btc_df(list(np.linspace(100, 200, 100))))
+        assert result['regime'] == 'BULL'
+        assert detector.get_cached_result() is result
+
+        detector._cache_expiry = 0.0
+        assert not detector.is_cache_valid()
+
+    def test_error_path_returns_shared_readonly_result(self, monkeypatch):
+        detector = MarketRegimeDetector()
+
+        def boom(df):
+            raise ValueError('bad data')
+
+        monkeypatch.setattr(detector, '_update_ma', boom)
+        df = _btc_df(list(np.linspace(100, 200, 100)))
+        result = detector.analyze(df)
+        assert isinstance(result, MappingProxyType)
+        assert result['regime'] == 'NEUTRAL'
+        assert detector.analyze(df, force_refresh=True) is result
@@ -0,0 +1,39 @@
+"""
+Tests for PositionManager
+"""
+
+from src.models import Position
+from src.utils.position_manager import PositionManager
+
+
+class TestPositionManager:
+    """Tests for exposure/risk aggregates"""
+
+    def test_totals_follow_add_and_remove(self):
+        pm = PositionManager(account_balance=10000.0)
+        pm.add_position('AAA/USDT', Position('AAA/USDT', size=1.0, notional=1000.0, risk_amount=50.0))
+        pm.add_position('BBB/USDT', Position('BBB/USDT', size=2.0, notional=500.0, risk_amount=20.0))
+        assert pm.get_total_exposure() == 1500.0
+        assert pm.get_total_risk() == 70.0
+
+        # 覆盖已有持仓
+        pm.add_position('AAA/USDT', Position('AAA/USDT', size=1.0, notional=800.0, risk_amount=40.0))
+        assert pm.get_total_exposure() == 1300.0
+        assert pm.get_total_risk() == 60.0
+
+        pm.remove_position('AAA/USDT')
+        pm.remove_position('CCC/USDT')
+        assert pm.get_total_exposure() == 500.0
+        assert pm.get_total_risk() == 20.0
+
+        pm.remove_position('BBB/USDT')
+        assert pm.get_total_exposure() == 0.0
+        assert pm.get_total_risk() == 0.0
+
+    def test_get_position_returns_record(self):
+        pm = PositionManager(account_balance=10000.0)
+        pos = Position('AAA/USDT', size=1.0, notional=1000.0, risk_amount=50.0, entry_price=1000.0)
+        pm.add_position('AAA/USDT', pos)
+        assert pm.get_position('AAA/USDT') is pos
+        assert pm.get_position('AAA/USDT').to_dict()['entry_price'] == 1000.0
+        assert pm.get_position('BBB/USDT') is None
@@ -1,4 +1,6 @@
+import math
 import unittest
+import numpy as np
 from src.models import StandardCandle
 from src.processors.data_processor import DataProcessor
 
@@ -18,9 +20,9 @@ class TestDataProcessor(unittest.TestCase):
         
         # Expected: Taker Buy USDT = 6 * 100 = 600
         # Expected: Taker Sell USDT = 4 * 100 = 400
-        self.assertEqual(df.iloc[0]['taker_buy_usdt'], 600.0)
-        self.assertEqual(df.iloc[0]['taker_sell_usdt'], 400.0)
-        self.assertEqual(df.iloc[0]['net_flow_usdt'], 200.0)
+        self.assertTrue(math.isclose(df.iloc[0]['taker_buy_usdt'], 600.0))
+        self.assertTrue(math.isclose(df.iloc[0]['taker_sell_usdt'], 400.0))
+        self.assertTrue(math.isclose(df.iloc[0]['net_flow_usdt'], 200.0))
 
     def test_processing_quote_volume(self):
         # Quote volume candle (OKX style)
@@ -35,8 +37,36 @@ class TestDataProcessor(unittest.TestCase):
         )
         df = DataProcessor.process_candles([c])
         
-        self.assertEqual(df.iloc[0]['taker_buy_usdt'], 500.0)
-        self.assertEqual(df.iloc[0]['taker_sell_usdt'], 300.0)
+        self.assertTrue(math.isclose(df.iloc[0]['taker_buy_usdt'], 500.0))
+        self.assertTrue(math.isclose(df.iloc[0]['taker_sell_usdt'], 300.0))
+
+    def test_processing_bulk_base(self):
+        # 一次处理整批K线（逆序输入），覆盖批量路径
+        n = 10000
+        candles = [
+            StandardCandle(
+                timestamp=1600000000000 + (n - i) * 60000,
+                open=100, high=110, low=90, close=100,
+                volume=10, taker_buy_volume=6, taker_sell_volume=4,
+                volume_type='base', exchange_id='binance'
+            )
+            for i in range(n)
+        ]
+        df = DataProcessor.process_candles(candles)
+
+        self.assertEqual(len(df), n)
+        self.assertTrue(df.index.is_monotonic_increasing)
+        self.assertTrue(np.allclose(df['taker_buy_usdt'].to_numpy(), 600.0))
+        self.assertTrue(np.allclose(df['net_flow_usdt'].to_numpy(), 200.0))
+
+    def test_processing_numpy_arrays_sorted(self):
+        c1 = StandardCandle(timestamp=1600000060000, open=2, high=4, low=1, close=3, volume=20)
+        c0 = StandardCandle(timestamp=1600000000000, open=1, high=3, low=0.5, close=2, volume=10)
+        o, h, l, c, v = DataProcessor.process_candles_np([c1, c0])
+
+        self.assertEqual(list(o), [1.0, 2.0])
+        self.assertEqual(list(c), [2.0, 3.0])
+        self.assertEqual(list(v), [10.0, 20.0])
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+from unittest import mock
+from src.services.realtime_monitor import RealtimeMonitor
+
+
+def _kline(symbol, open_price, close_price, quote_volume):
+    return {'k': {'s': symbol, 'o': str(open_price), 'c': str(close_price),
+                  'q': str(quote_volume), 'x': False}}
+
+
+class TestRealtimeCooldown(unittest.TestCase):
+    def setUp(self):
+        self.monitor = RealtimeMonitor()
+        self.monitor.pump_threshold = 5.0
+        self.monitor.min_volume = 1000
+        self.alerts = []
+
+        async def fake_alert(symbol, *args):
+            self.alerts.append(symbol)
+
+        self.monitor._trigger_alert = fake_alert
+
+    def _feed(self, now, symbol='ABCUSDT'):
+        data = _kline(symbol, 100, 110, 50000)
+
+        async def feed():
+            self.monitor._process_kline(data, 'spot', now)
+            if self.monitor._alert_tasks:
+                await asyncio.gather(*self.monitor._alert_tasks)
+
+        asyncio.run(feed())
+
+    def test_cooldown_suppresses_repeat(self):
+        self._feed(1000.0)
+        self._feed(1100.0)
+        self.assertEqual(self.alerts, ['ABCUSDT'])
+
+    def test_cooldown_survives_bucket_rotation(self):
+        cd = self.monitor.cooldown_sec
+        self._feed(1000.0, symbol='XYZUSDT')
+        self._feed(1000.0 + cd / 2)
+        # 触发轮换，ABCUSDT 进入上一桶，冷却仍然有效
+        self._feed(1000.0 + cd, symbol='XYZUSDT')
+        self._feed(1000.0 + cd + 1)
+        self.assertEqual(self.alerts, ['XYZUSDT', 'ABCUSDT', 'XYZUSDT'])
+        # 冷却期满后再次告警
+        self._feed(1000.0 + cd / 2 + cd + 1)
+        self.assertEqual(self.alerts, ['XYZUSDT', 'ABCUSDT', 'XYZUSDT', 'ABCUSDT'])
+
+    def test_below_threshold_is_ignored(self):
+        # 10% 涨幅低于调高后的阈值
+        self.monitor.pump_threshold = 20.0
+        self._feed(1000.0)
+        self.assertEqual(self.alerts, [])
+
+    def test_expired_entries_are_dropped(self):
+        cd = self.monitor.cooldown_sec
+        self._feed(1000.0)
+        self._feed(1000.0 + 2 * cd, symbol='XYZUSDT')
+        self._feed(1000.0 + 3 * cd, symbol='XYZUSDT')
+        self.assertNotIn(('spot', 'ABCUSDT'), self.monitor._cd_cur)
+        self.assertNotIn(('spot', 'ABCUSDT'), self.monitor._cd_prev)
+
+
+class TestRealtimeAlertTasks(unittest.TestCase):
+    def test_alert_exception_is_logged(self):
+        monitor = RealtimeMonitor()
+        monitor.pump_threshold = 5.0
+        monitor.min_volume = 1000
+
+        async def failing_alert(*args):
+            raise RuntimeError('send failed')
+
+        monitor._trigger_alert = failing_alert
+
+        async def feed():
+            monitor._process_kline(_kline('ABCUSDT', 100, 110, 50000), 'spot', 1000.0)
+            # 让任务完成并执行结束回调
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+        with mock.patch('src.services.realtime_monitor.logger') as log:
+            asyncio.run(feed())
+        log.opt.return_value.error.assert_called_once()
+        self.assertEqual(monitor._alert_tasks, set())
+
+    def test_concurrent_sends_are_capped(self):
+        active = 0
+        peak = 0
+
+        class SlowNotifier:
+            async def send_realtime_pump_alert(self, alert, is_strategy_learned=False):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        async def run():
+            monitor = RealtimeMonitor(notification_service=SlowNotifier())
+            await asyncio.gather(*(
+                monitor._trigger_alert(f'S{i}USDT', 10.0, 50000.0, 1.0, False, 'spot')
+                for i in range(10)
+            ))
+
+        with mock.patch('src.services.realtime_monitor.Config.REALTIME_ALERT_MAX_CONCURRENT', 3):
+            asyncio.run(run())
+        self.assertEqual(peak, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()